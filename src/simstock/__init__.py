@@ -7,7 +7,8 @@ from simstock.io import (
 )
 from simstock.base import (
     SimstockDataframe,
-    IDFmanager
+    IDFmanager,
+    create_idfs
 )
 from simstock.plotting import (
     plot
@@ -23,6 +24,6 @@ __all__ = [
     "read_json",
     "get_gpkg_layer_names",
     "IDFmanager",
-    "create_idf",
+    "create_idfs",
     "plot"
     ]
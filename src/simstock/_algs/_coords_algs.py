@@ -7,6 +7,7 @@ be used directly through the API.
 
 from typing import Any, Union
 import math
+import numpy as np
 from shapely.geometry import (
     LineString, 
     LinearRing,
@@ -38,7 +39,7 @@ def _dist_within_tol(coords: list, tol: float) -> bool:
     tolerance, then the function returns True.
     """
     for i in range(len(coords)-1):
-        if LineString([coords[i], coords[i+1]]).length < tol:
+        if _dist_two_points(coords[i], coords[i+1]) < tol:
             return True
     return False
 
@@ -85,7 +86,7 @@ def _radial_dist_simplify(coords: list, tol: float):
     for i in range(len(coords) - 1):
         first = coords[i]
         second = coords[i+1]
-        if LineString([first, second]).length < tol:
+        if _dist_two_points(first, second) < tol:
             if i < (len(coords) - 2):
                 coord_remove = second
                 coord_leave = first
@@ -139,8 +140,6 @@ def _ccw_interior_ring(coords: list) -> list:
     return coords
 
 
-# This could be sped up, perhaps
-# by using itertools
 def _remove_buffered_coordinates(
         coords: list,
         new: list,
@@ -155,40 +154,22 @@ def _remove_buffered_coordinates(
     the coordinate list are removed before the 
     list is returned.
     """
-    
-    # Iterate through all the coordinates 
-    # flagged for removal
-    for r_c in removed:
 
-        # Then iterate through each coordinate
-        # in the list 
-        for i, coord in enumerate(coords):
-
-            # If this coordinate is one of the
-            # coordinates flagged for removal 
-            if coord == r_c:
-
-                # Then calculate the distance from this removed
-                # coordinate to the first of the new ones and 
-                # select this first one as a candidate 
-                # replacement coordinate
-                minimum_dist = LineString([r_c, new[0]]).length
-                replacement_coord = new[0]
-
-                # Now go through the rest of the new coords
-                # and compute each of their distances to the
-                # removed coord. Keep a track of the closest
-                # of the new coordinates to the removed one
-                for n_c in new:
-                    dist = LineString([r_c, n_c]).length
-                    if dist < minimum_dist:
-                        minimum_dist = dist
-                        replacement_coord = n_c
-
-                # Now replace this coordinate, which was flagged
-                # for removal, with the closest candiate new 
-                # coordinate
-                coords[i] = replacement_coord
+    if removed:
+        # Find the closest of the new coordinates to each of
+        # the removed ones all at once. Ties go to the first
+        removed_xy = np.asarray(removed, dtype=float)
+        new_xy = np.asarray(new, dtype=float)
+        dx = removed_xy[:, None, 0] - new_xy[None, :, 0]
+        dy = removed_xy[:, None, 1] - new_xy[None, :, 1]
+        closest = np.argmin(np.sqrt(dx*dx + dy*dy), axis=1)
+        replacement = {
+            r_c: new[k] for r_c, k in zip(removed, closest.tolist())
+            }
+
+        # Now replace each coordinate flagged for removal 
+        # with its closest candidate new coordinate
+        coords = [replacement.get(coord, coord) for coord in coords]
 
     # Wash out any duplicates
     return _remove_dups_from_list(coords)
@@ -200,23 +181,20 @@ def _coollinear_points(coord_list: list) -> list:
     returns a list of collinear points 
     to be removed.
     """
-    removed_coll = list()
-    if len(coord_list) >= 3:
-
-        # Go through the coordinates and select
-        # a sliding window of three points
-        for i in range(len(coord_list) - 2):
-            first = coord_list[i]
-            middle = coord_list[i + 1]
-            last = coord_list[i + 2]
-
-            # Pass these to a function to check their 
-            # collinearity. If it returns true, then 
-            # add the middle of the three points of the 
-            # list of collinear points
-            if algs._check_collinearity(first, middle, last):
-                removed_coll.append(coord_list[i + 1])
-    return removed_coll
+    if len(coord_list) < 3:
+        return list()
+
+    # Take a sliding window of three points over the coordinates
+    # and compute the area of the triangle each window forms, in
+    # the same way as algs._check_collinearity. The middle point
+    # of each degenerate triangle is collinear
+    coords = np.asarray(coord_list, dtype=float)
+    first, middle, last = coords[:-2], coords[1:-1], coords[2:]
+    area = np.abs(
+        (middle[:, 0] - first[:, 0]) * (first[:, 1] - last[:, 1])
+        + (last[:, 0] - first[:, 0]) * (middle[:, 1] - first[:, 1])
+        ) / 2
+    return [coord_list[i + 1] for i in np.flatnonzero(area <= 1e-9)]
 
 
 def coordinates_move_origin(coordinates_list: list, origin) -> list:
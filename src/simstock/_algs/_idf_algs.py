@@ -3,17 +3,62 @@ Module containing routines for generating
 objects for E+
 """
 
-from typing import Any, Union
+from typing import Any, Iterator, NamedTuple, Union
 import math
-from shapely.geometry import LineString
 import simstock._algs._coords_algs as calgs
 import simstock._algs._polygon_algs as palgs
-from pandas.core.series import Series
 from pandas.core.frame import DataFrame
 from eppy.modeleditor import IDF
 from shapely.geometry import Polygon
 
 
+# The classes of the ideal loads system objects created for each zone
+_IDEAL_LOADS_CLASSES = (
+    'ZONEHVAC:IDEALLOADSAIRSYSTEM',
+    'ZONEHVAC:EQUIPMENTLIST',
+    'ZONEHVAC:EQUIPMENTCONNECTIONS',
+)
+
+
+# Fields of the ideal loads objects that are the same for every zone
+_IDEAL_LOADS_CONST = {'Dehumidification_Control_Type': 'None'}
+_EQUIPMENT_LIST_CONST = {
+    'Zone_Equipment_1_Object_Type': 'ZONEHVAC:IDEALLOADSAIRSYSTEM',
+    'Zone_Equipment_1_Cooling_Sequence': 1,
+    'Zone_Equipment_1_Heating_or_NoLoad_Sequence': 1,
+}
+
+
+def _ideal_loads_fields(zone: str) -> tuple:
+    """
+    Returns the fields of the ideal loads air system, equipment list 
+    and equipment connections objects for a zone, as dicts in 
+    the order of ``_IDEAL_LOADS_CLASSES``.
+    """
+    system_name = f"{zone}_HVAC"
+    eq_name = f"{zone}_Eq"
+    supp_air_node = f"{zone}_supply"
+    return (
+        {
+            'Name': system_name,
+            'Zone_Supply_Air_Node_Name': supp_air_node,
+            **_IDEAL_LOADS_CONST
+        },
+        {
+            'Name': eq_name,
+            'Zone_Equipment_1_Name': system_name,
+            **_EQUIPMENT_LIST_CONST
+        },
+        {
+            'Zone_Name': zone,
+            'Zone_Conditioning_Equipment_List_Name': eq_name,
+            'Zone_Air_Inlet_Node_or_NodeList_Name': supp_air_node,
+            'Zone_Air_Node_Name': f"{zone}_air_node",
+            'Zone_Return_Air_Node_or_NodeList_Name': f"{zone}_return"
+        },
+    )
+
+
 def _set_construction(construction: str, element: str) -> str:
     """
     Returns the relevant name of the building surface depending on the 
@@ -31,26 +76,74 @@ def _set_construction(construction: str, element: str) -> str:
         return "ceiling_inverse"
     
 
+def _row_field(column: Any) -> Any:
+    """
+    Returns the name under which a column is accessed on the rows
+    given by :func:`_rows`. The per-floor use columns, e.g. 
+    "FLOOR_1: use", are not valid identifiers, so they become 
+    e.g. "FLOOR_1_use".
+    """
+    if isinstance(column, str):
+        return column.replace(": use", "_use")
+    return column
+
+
+def _rows(df: DataFrame) -> Iterator[NamedTuple]:
+    """
+    Returns an iterator over the rows of df as named tuples, which
+    are much cheaper to build and read than the row Series given
+    by ``DataFrame.apply``.
+    """
+    return df.rename(columns=_row_field, copy=False).itertuples(index=False)
+
+
+def _osgb_lookup(df: DataFrame) -> dict:
+    """
+    Returns a dict mapping each osgb in df to the polygon and height
+    of its (first) row, so that adjacent buildings can be looked up
+    without scanning the whole ``osgb`` column each time.
+    """
+    osgbs = df['osgb'].to_numpy()[::-1]
+    values = zip(df['polygon'].to_numpy()[::-1], df['height'].to_numpy()[::-1])
+    return dict(zip(osgbs, values))
+
+
+def _zone_use(row: NamedTuple, floor_no: int) -> str:
+    """
+    Returns the use of floor ``floor_no`` of the building in row,
+    which defaults to "Dwell" if the data has no use for it.
+    """
+    return getattr(row, f"FLOOR_{floor_no}_use", "Dwell")
+
+
 def _mixed_use(idf: IDF, zone_use_dict: dict) -> None:
+    """
+    Internal function to create a zonelist for each use, given
+    zone_use_dict mapping each zone name to its (use, osgb)
+    """
 
     # Check for missing values
-    for key, value in zone_use_dict.items():
+    for key, (value, _) in zone_use_dict.items():
         if not isinstance(value, str) and math.isnan(value):
             raise ValueError(f"{key} has no value for 'use'.")
 
+    # Group the zones by use in a single pass, lower-casing
+    # each distinct use only once to remove case-sensitivity
+    lower = {
+        value: value.lower() for value, _ in set(zone_use_dict.values())
+        }
+    zones_by_use = dict()
+    for key, (value, _) in zone_use_dict.items():
+        zones_by_use.setdefault(lower[value], []).append(key)
+
     # Create a zonelist for each use
-    use_list = list(zone_use_dict.values())
-    use_list = list(map(str.lower, use_list)) #remove case-sensitivity
-    use_list = list(set(use_list))
+    use_set = set(zones_by_use)
+    use_list = list(use_set)
     for use in use_list:
-        zone_list = list()
-        for key, value in zone_use_dict.items():
-            if value.lower() == use:
-                zone_list.append(key)
-        idf.newidfobject('ZONELIST', Name=use)
-        objects = idf.idfobjects['ZONELIST'][-1]
+        zone_list = zones_by_use[use]
+        objects = idf.newidfobject('ZONELIST', Name=use)
         for i, zone in enumerate(zone_list):
-            exec('objects.Zone_%s_Name = zone' % (i + 1))
+            setattr(objects, f'Zone_{i + 1}_Name', zone)
     
     objects_to_delete = list()
     for obj in ['PEOPLE', 'LIGHTS', 'ELECTRICEQUIPMENT',
@@ -58,7 +151,7 @@ def _mixed_use(idf: IDF, zone_use_dict: dict) -> None:
                 'ZONECONTROL:THERMOSTAT']:
         objects = idf.idfobjects[obj]
         for item in objects:
-            if item.Zone_or_ZoneList_Name.lower() not in use_list:
+            if item.Zone_or_ZoneList_Name.lower() not in use_set:
                 objects_to_delete.append(item)
 
     for item in objects_to_delete:
@@ -66,8 +159,8 @@ def _mixed_use(idf: IDF, zone_use_dict: dict) -> None:
 
 
 # This could be broken into two functions
-def _thermal_zones(row: Series,
-                   df: DataFrame,
+def _thermal_zones(row: NamedTuple,
+                   adjacent: dict,
                    idf: IDF,
                    origin: list,
                    min_avail_width_for_window: Union[float, int],
@@ -76,7 +169,8 @@ def _thermal_zones(row: Series,
                    ) -> None:
     """
     Internal function to create thermal zone objects
-    for use by E+
+    for use by E+. adjacent maps each osgb to the polygon 
+    and height of that building, see _osgb_lookup
     """
     polygon = row.polygon
     # Polygon with removed collinear point to be used for ceiling/floor/roof
@@ -91,8 +185,19 @@ def _thermal_zones(row: Series,
     ext_surf_polygon = row.polygon_exposed_wall
     # List of external surface only coordinates (ext_surf_polygon + in. rings)
     ext_surf_coord = palgs._surface_coordinates(ext_surf_polygon, origin)
-    # List of adjacent polygons
-    adj_osgb_list = row.touching
+    # Partition wall coordinates for each adjacent polygon, together
+    # with its height. These are the same for every floor, so are
+    # only computed once
+    adj_walls = []
+    for adj_osgb in row.touching:
+        adj_polygon, adj_height = adjacent[adj_osgb]
+        # Find the intersection between two polygons (it will be
+        # LineString or MultiLineString) and position coordinates
+        # relative to origin
+        part_wall_polygon = polygon.intersection(adj_polygon)
+        adj_wall_parti_surf_coord = palgs._surface_coordinates(
+            part_wall_polygon, origin)
+        adj_walls.append((adj_osgb, adj_height, adj_wall_parti_surf_coord))
 
     height = row.height
     glazing_ratio = row.wwr
@@ -111,10 +216,7 @@ def _thermal_zones(row: Series,
         floor_no = int(1)
         x = row.osgb
         zone_name = f'{x}_floor_{floor_no}'
-        try:
-            zone_use_dict[zone_name] = row["FLOOR_1: use"]
-        except KeyError:
-            zone_use_dict[zone_name] = "Dwell"
+        zone_use_dict[zone_name] = (_zone_use(row, 1), row.osgb)
         zone_floor_h = 0
         space_below_floor = 'Ground'
         zone_ceiling_h = height
@@ -139,23 +241,11 @@ def _thermal_zones(row: Series,
                        overhang_depth)
 
         # Partition walls where adjacent polygons exist
-        if adj_osgb_list:
+        if adj_walls:
             # Surface type; no sun exposure; no wind exposure
             partition_const = 'partition'
             # Loop through the list of adjacent objects
-            for adj_osgb in adj_osgb_list:
-                opposite_zone = adj_osgb
-                # Extract polygon from the adjacent objects DataFrame
-                adj_polygon = df.loc[df['osgb'] == adj_osgb,
-                                           'polygon'].values[0]
-                adj_height = df.loc[df['osgb'] == adj_osgb,
-                                    'height'].values[0]
-                # Find the intersection between two polygons (it will be
-                # LineString or MultiLineString) and position coordinates
-                # relative to origin
-                part_wall_polygon = polygon.intersection(adj_polygon)
-                adj_wall_parti_surf_coord = palgs._surface_coordinates(
-                    part_wall_polygon, origin)
+            for opposite_zone, adj_height, adj_wall_parti_surf_coord in adj_walls:
                 if zone_ceiling_h < adj_height + 1e-6:
                     _partition_walls(idf, zone_name, opposite_zone,
                                     adj_wall_parti_surf_coord,
@@ -191,10 +281,7 @@ def _thermal_zones(row: Series,
             if item == 0:
                 x = row.osgb
                 zone_name = f'{x}_floor_{floor_no}'
-                try:
-                    zone_use_dict[zone_name] = row[f"FLOOR_{floor_no}: use"]
-                except KeyError:
-                    zone_use_dict[zone_name] = "Dwell"
+                zone_use_dict[zone_name] = (_zone_use(row, floor_no), row.osgb)
                 zone_floor_h = item * f2f
                 space_below_floor = 'Ground'
                 zone_ceiling_h = floor_no * f2f
@@ -218,23 +305,11 @@ def _thermal_zones(row: Series,
                     glazing_ratio, overhang_depth)
 
                 # Partition walls where adjacent polygons exist
-                if adj_osgb_list:
+                if adj_walls:
                     # Surface type; no sun exposure; no wind exposure
                     partition_const = 'partition'
                     # Loop through the list of adjacent objects
-                    for adj_osgb in adj_osgb_list:
-                        opposite_zone = adj_osgb
-                        # Extract polygon from the adjacent objects DataFrame
-                        adj_polygon = df.loc[df['osgb'] == adj_osgb,
-                                                   'polygon'].values[0]
-                        adj_height = df.loc[df['osgb'] == adj_osgb,
-                                            'height'].values[0]
-                        # Find the intersection between two polygons (it will
-                        # be LineString or MultiLineString) and position
-                        # coordinates relative to origin
-                        part_wall_polygon = polygon.intersection(adj_polygon)
-                        adj_wall_parti_surf_coord = palgs._surface_coordinates(
-                            part_wall_polygon, origin)
+                    for opposite_zone, adj_height, adj_wall_parti_surf_coord in adj_walls:
                         if zone_ceiling_h < adj_height + 1e-6:
                             _partition_walls(idf, zone_name, opposite_zone,
                                             adj_wall_parti_surf_coord,
@@ -264,10 +339,7 @@ def _thermal_zones(row: Series,
 
             elif item == row.nofloors - 1:
                 zone_name = f'{row.osgb}_floor_{floor_no}'
-                try:
-                    zone_use_dict[zone_name] = row[f"FLOOR_{floor_no}: use"]
-                except KeyError:
-                    zone_use_dict[zone_name] = "Dwell"
+                zone_use_dict[zone_name] = (_zone_use(row, floor_no), row.osgb)
                 zone_floor_h = item * f2f
                 space_below_floor = f'{row.osgb}_floor_{floor_no-1}'
                 zone_ceiling_h = height
@@ -291,23 +363,11 @@ def _thermal_zones(row: Series,
                     glazing_ratio, overhang_depth)
 
                 # Partition walls where adjacent polygons exist
-                if adj_osgb_list:
+                if adj_walls:
                     # Surface type; no sun exposure; no wind exposure
                     partition_const = 'partition'
                     # Loop through the list of adjacent objects
-                    for adj_osgb in adj_osgb_list:
-                        opposite_zone = adj_osgb
-                        # Extract polygon from the adjacent objects DataFrame
-                        adj_polygon = df.loc[df['osgb'] == adj_osgb,
-                                                   'polygon'].values[0]
-                        adj_height = df.loc[df['osgb'] == adj_osgb,
-                                            'height'].values[0]
-                        # Find the intersection between two polygons (it will
-                        # be LineString or MultiLineString) and position
-                        # coordinates relative to origin
-                        part_wall_polygon = polygon.intersection(adj_polygon)
-                        adj_wall_parti_surf_coord = palgs._surface_coordinates(
-                            part_wall_polygon, origin)
+                    for opposite_zone, adj_height, adj_wall_parti_surf_coord in adj_walls:
                         if zone_ceiling_h < adj_height + 1e-6:
                             _partition_walls(idf, zone_name, opposite_zone,
                                             adj_wall_parti_surf_coord,
@@ -337,10 +397,7 @@ def _thermal_zones(row: Series,
 
             else:
                 zone_name = f'{row.osgb}_floor_{floor_no}'
-                try:
-                    zone_use_dict[zone_name] = row[f"FLOOR_{floor_no}: use"]
-                except KeyError:
-                    zone_use_dict[zone_name] = "Dwell"
+                zone_use_dict[zone_name] = (_zone_use(row, floor_no), row.osgb)
                 zone_floor_h = item * f2f
                 space_below_floor = f'{row.osgb}_floor_{floor_no-1}'
                 zone_ceiling_h = floor_no * f2f
@@ -365,23 +422,11 @@ def _thermal_zones(row: Series,
                     glazing_ratio, overhang_depth)
 
                 # Partition walls where adjacent polygons exist
-                if adj_osgb_list:
+                if adj_walls:
                     # Surface type; no sun exposure; no wind exposure
                     partition_const = 'partition'
                     # Loop through the list of adjacent objects
-                    for adj_osgb in adj_osgb_list:
-                        opposite_zone = adj_osgb
-                        # Extract polygon from the adjacent objects DataFrame
-                        adj_polygon = df.loc[df['osgb'] == adj_osgb,
-                                                   'polygon'].values[0]
-                        adj_height = df.loc[df['osgb'] == adj_osgb,
-                                            'height'].values[0]
-                        # Find the intersection between two polygons (it will
-                        # be LineString or MultiLineString) and position
-                        # coordinates relative to origin
-                        part_wall_polygon = polygon.intersection(adj_polygon)
-                        adj_wall_parti_surf_coord = palgs._surface_coordinates(
-                            part_wall_polygon, origin)
+                    for opposite_zone, adj_height, adj_wall_parti_surf_coord in adj_walls:
                         if zone_ceiling_h < adj_height + 1e-6:
                             _partition_walls(idf, zone_name, opposite_zone,
                                             adj_wall_parti_surf_coord,
@@ -432,6 +477,27 @@ def _idf_ceiling_coordinates_list(ceiling_coordinates_list: list) -> list:
     return idf_ceiling_coordinates_list
 
 
+def _segment_centroid(p0: list, p1: list) -> tuple:
+    '''
+    Function which returns the centroid, i.e. the midpoint, of the 
+    2D line segment from p0 to p1
+    '''
+    mid_x = (p0[0] + p1[0]) / 2.0
+    mid_y = (p0[1] + p1[1]) / 2.0
+    dx = p1[0] - p0[0]
+    dy = p1[1] - p0[1]
+    length = math.sqrt(dx * dx + dy * dy)
+    if length == 0:
+        return mid_x, mid_y
+    # GEOS computes a LineString's centroid as its length-weighted
+    # sum of segment midpoints over its length, which can differ from
+    # the plain midpoint in the last bit. Surface names are built from
+    # this centre rounded to 2 d.p., so the same arithmetic is kept
+    # here; otherwise some surfaces would be renamed relative to IDFs
+    # generated before, and to the E+ outputs keyed by those names
+    return (length * mid_x) / length, (length * mid_y) / length
+
+
 def _wall_centre_coordinate(
         ceil_1: str,
         ceil_0: str,
@@ -442,17 +508,10 @@ def _wall_centre_coordinate(
     string with centre coordinate (X,Y,Z). Useful for surface naming
     particularly in partition walls due to required opposite surface wall name
     '''
-    # List of horizontal/vertical coordinates ordered pair strings
-    hor = [ceil_1, ceil_0]
-    ver = [ceil_0, floor_0]
-    # Exclude Z and X coordinate from horizontal and vertical coordinates resp
-    hor = [item[:-1] for item in hor]
-    ver = [item[1:] for item in ver]
-    # By using shapley obtain the centre coordinate between ordered pairs
-    hor = LineString(hor).centroid
-    hor = hor.coords[0]
-    ver = LineString(ver).centroid
-    ver = ver.coords[0]
+    # Obtain the centre coordinate between the horizontal ordered pairs,
+    # excluding Z, and between the vertical ordered pairs, excluding X
+    hor = _segment_centroid(ceil_1[:-1], ceil_0[:-1])
+    ver = _segment_centroid(ceil_0[1:], floor_0[1:])
     # Wall centre coordinate is created from horizontal ordered pair appended
     # with Z coordinate (ver[-1]) from vertical ordered pair
     wcc = hor + (ver[-1],)
@@ -503,17 +562,16 @@ def _shading_building_detailed(
     '''
     Function which creates ShadingBuilding:Detailed energyplus object
     '''
-    idf.newidfobject(
+    objects = idf.newidfobject(
         'Shading:Building:Detailed'.upper(),
         Name=surface_name)
-    # Add coordinates to the latest added energyplus object
-    objects = idf.idfobjects['Shading:Building:Detailed'.upper()][-1]
+    # Add coordinates to the newly added energyplus object
     # Loop through coordinates list and assign X, Y, and Z vertex of each#
     # ordered pair to the associated Vertex coordinate
     for i, ordered_pair in enumerate(coordinates):
-        exec(f'objects.Vertex_{i+1}_Xcoordinate = ordered_pair[0]')
-        exec(f'objects.Vertex_{i+1}_Ycoordinate = ordered_pair[1]')
-        exec(f'objects.Vertex_{i+1}_Zcoordinate = ordered_pair[2]')
+        setattr(objects, f'Vertex_{i+1}_Xcoordinate', ordered_pair[0])
+        setattr(objects, f'Vertex_{i+1}_Ycoordinate', ordered_pair[1])
+        setattr(objects, f'Vertex_{i+1}_Zcoordinate', ordered_pair[2])
     return
 
 
@@ -666,7 +724,7 @@ def _building_surface_detailed(
     '''
     Function which creates BuildingSurface:Detailed energyplus object
     '''
-    idf.newidfobject(
+    objects = idf.newidfobject(
         'BuildingSurface:Detailed'.upper(),
         Name=surface_name,
         Surface_Type=surface_type,
@@ -676,14 +734,13 @@ def _building_surface_detailed(
         Outside_Boundary_Condition_Object=outside_boundary_condition_object,
         Sun_Exposure=sun_exposure,
         Wind_Exposure=wind_exposure)
-    # Add coordinates to the latest added energyplus object
-    objects = idf.idfobjects['BuildingSurface:Detailed'.upper()][-1]
+    # Add coordinates to the newly added energyplus object
     # Loop through coordinates list and assign X, Y, and Z vertex of each
     # ordered pair to the associated Vertex coordinate
     for i, ordered_pair in enumerate(coordinates):
-        exec('objects.Vertex_%s_Xcoordinate = ordered_pair[0]' % (i + 1))
-        exec('objects.Vertex_%s_Ycoordinate = ordered_pair[1]' % (i + 1))
-        exec('objects.Vertex_%s_Zcoordinate = ordered_pair[2]' % (i + 1))
+        setattr(objects, f'Vertex_{i+1}_Xcoordinate', ordered_pair[0])
+        setattr(objects, f'Vertex_{i+1}_Ycoordinate', ordered_pair[1])
+        setattr(objects, f'Vertex_{i+1}_Zcoordinate', ordered_pair[2])
     return
 
 
@@ -958,42 +1015,46 @@ def _partition_walls(
             
 
 def _shading_volumes(
-        row: Series,
+        shading_df: DataFrame,
         df: DataFrame,
         idf: IDF,
         origin: list
         ) -> None:
     '''
     Function which generates idf geometry for surrounding Build Blocks. All
-    elements are converted to shading objects
+    elements are converted to shading objects. The buildings in shading_df
+    are processed in one go, so that the adjacent buildings are looked up
+    from df only once
     '''
-    # Polygon name and coordinates
-    osgb, polygon = row.osgb, row.polygon
-    # Polygon with removed collinear point to be used for ceiling/floor/roof
-    hor_polygon = row.polygon_horizontal
-    # Convert polygon coordinates to dictionary of outer and inner
-    # (if any) coordinates
-    hor_poly_coord_dict = palgs._polygon_coordinates_dictionary(hor_polygon)
-    # List of adjacent polygons
-    adj_osgb_list = row.touching
-    # Load the polygon which defines only external surfaces
-    ext_surf_polygon = row.polygon_exposed_wall
-    # List of external surface only coordinates (ext_surf_polygon +
-    # inner rings)
-    ext_surf_coord = palgs._surface_coordinates(ext_surf_polygon, origin)
-    # # List of horizontal surfaces coordinates (roof/floor/ceiling)
-    horiz_surf_coord = calgs._horizontal_surface_coordinates(
-        hor_poly_coord_dict, origin)
-    # Zone bottom/top vertical vertex
-    zone_floor_h = 0
-    zone_ceiling_h = row.height
-    # Include adiabatic roof
-    _adiabatic_roof(idf, osgb, horiz_surf_coord, zone_ceiling_h)
-    adiabatic_wall_name = 'AdiabaticWall'
-    # Create external walls
-    adiabatic_external_walls(idf, osgb, ext_surf_coord, zone_ceiling_h,
-                             zone_floor_h, adiabatic_wall_name,
-                             adj_osgb_list, df, polygon, origin)
+    adjacent = _osgb_lookup(df)
+    for row in _rows(shading_df):
+        # Polygon name and coordinates
+        osgb, polygon = row.osgb, row.polygon
+        # Polygon with removed collinear point to be used for ceiling/floor/roof
+        hor_polygon = row.polygon_horizontal
+        # Convert polygon coordinates to dictionary of outer and inner
+        # (if any) coordinates
+        hor_poly_coord_dict = palgs._polygon_coordinates_dictionary(hor_polygon)
+        # List of adjacent polygons
+        adj_osgb_list = row.touching
+        # Load the polygon which defines only external surfaces
+        ext_surf_polygon = row.polygon_exposed_wall
+        # List of external surface only coordinates (ext_surf_polygon +
+        # inner rings)
+        ext_surf_coord = palgs._surface_coordinates(ext_surf_polygon, origin)
+        # # List of horizontal surfaces coordinates (roof/floor/ceiling)
+        horiz_surf_coord = calgs._horizontal_surface_coordinates(
+            hor_poly_coord_dict, origin)
+        # Zone bottom/top vertical vertex
+        zone_floor_h = 0
+        zone_ceiling_h = row.height
+        # Include adiabatic roof
+        _adiabatic_roof(idf, osgb, horiz_surf_coord, zone_ceiling_h)
+        adiabatic_wall_name = 'AdiabaticWall'
+        # Create external walls
+        adiabatic_external_walls(idf, osgb, ext_surf_coord, zone_ceiling_h,
+                                 zone_floor_h, adiabatic_wall_name,
+                                 adj_osgb_list, adjacent, polygon, origin)
     return
 
 
@@ -1005,7 +1066,7 @@ def adiabatic_external_walls(
         floor_height: Union[float, int],
         wall_name: str,
         adjacent_polygons_list: list,
-        df: DataFrame,
+        adjacent: dict,
         polygon_shapely: Polygon,
         origin: list
         ) -> None:
@@ -1014,7 +1075,8 @@ def adiabatic_external_walls(
     is composed of two parts (1) external walls which are not parts of adjacent
     surfaces and (2) external walls which are parts of adjacent surfaces. the
     second case will have other elements as well which are defined somewhere
-    else within the main function
+    else within the main function. adjacent maps each osgb to the polygon
+    and height of that building, see _osgb_lookup
     '''
 
     # Create adiabatic external walls for non-adjacent surfaces
@@ -1024,21 +1086,14 @@ def adiabatic_external_walls(
     if adjacent_polygons_list:
         # Loop through the list of adjacent objects
         for polygon in adjacent_polygons_list:
-            # Slice the built block DataFrame to include only records for
-            # adjacent object
-            adjacent_polygon_df = df.loc[df['osgb'] == polygon]
-            # Extract polygon from the adjacent objects DataFrame
-            adjacent_polygon = adjacent_polygon_df['polygon'].iloc[0]
-            # Convert polygon to shapley object
-            adjacent_polygon = adjacent_polygon
+            # Look up the polygon and height of the adjacent object
+            adjacent_polygon, adjacent_height = adjacent[polygon]
 
             # Find the intersection between two polygons (it will be LineString
             # or MultiLineString) and position coordinates relative to origin
             part_wall_polygon = polygon_shapely.intersection(adjacent_polygon)
             ajd_wall_parti_surf_coord = palgs._surface_coordinates(part_wall_polygon,
                                                             origin)
-            # Extract the height of an adjacent object
-            adjacent_height = adjacent_polygon_df['height'].iloc[0]
             # Check if the ceiling height is above the height of the adjacent
             # object. If not than there is no adiabatic external wall above the
             # adjacent object. If yes, than check the relation of floor height
@@ -1067,7 +1122,7 @@ def adiabatic_external_walls(
         floor_height: Union[float, int],
         wall_name: str,
         adjacent_polygons_list: list,
-        df: DataFrame,
+        adjacent: dict,
         polygon_shapely: Polygon,
         origin: list
         ) -> None:
@@ -1076,7 +1131,8 @@ def adiabatic_external_walls(
     is composed of two parts (1) external walls which are not parts of adjacent
     surfaces and (2) external walls which are parts of adjacent surfaces. the
     second case will have other elements as well which are defined somewhere
-    else within the main function
+    else within the main function. adjacent maps each osgb to the polygon
+    and height of that building, see _osgb_lookup
     '''
 
     # Create adiabatic external walls for non-adjacent surfaces
@@ -1086,21 +1142,14 @@ def adiabatic_external_walls(
     if adjacent_polygons_list:
         # Loop through the list of adjacent objects
         for polygon in adjacent_polygons_list:
-            # Slice the built block DataFrame to include only records for
-            # adjacent object
-            adjacent_polygon_df = df.loc[df['osgb'] == polygon]
-            # Extract polygon from the adjacent objects DataFrame
-            adjacent_polygon = adjacent_polygon_df['polygon'].iloc[0]
-            # Convert polygon to shapley object
-            adjacent_polygon = adjacent_polygon
+            # Look up the polygon and height of the adjacent object
+            adjacent_polygon, adjacent_height = adjacent[polygon]
 
             # Find the intersection between two polygons (it will be LineString
             # or MultiLineString) and position coordinates relative to origin
             part_wall_polygon = polygon_shapely.intersection(adjacent_polygon)
             ajd_wall_parti_surf_coord = palgs._surface_coordinates(part_wall_polygon,
                                                             origin)
-            # Extract the height of an adjacent object
-            adjacent_height = adjacent_polygon_df['height'].iloc[0]
             # Check if the ceiling height is above the height of the adjacent
             # object. If not than there is no adiabatic external wall above the
             # adjacent object. If yes, than check the relation of floor height
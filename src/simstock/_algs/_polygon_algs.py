@@ -11,6 +11,8 @@ user-facing API.
 """
 
 from typing import Union
+import numpy as np
+import shapely as shp
 from shapely.geometry import (
     Polygon, 
     LinearRing,
@@ -20,7 +22,6 @@ from shapely.geometry import (
 )
 from pandas.core.frame import DataFrame
 import simstock._algs._coords_algs as calgs
-from simstock._utils._serialisation import _load_gdf
 from shapely.wkt import loads
 from shapely.ops import unary_union
 
@@ -47,45 +48,31 @@ def _check_for_multi(
     return (False, polygon)
 
 
-def _shading_buffer(
+def _shading_hull(
         shading_buffer_radius: Union[float, int],
-        df: DataFrame,
-        rest: DataFrame
-        ) -> DataFrame:
-    """
-    Includes polygons which fall within a specified shading buffer radius in the main DataFrame.
-
-    Inputs:
-        - shading_buffer_radius: Radius in metres within which other polygons are included. An
-            empty string is interpreted as an infinite radius.
-        - df: The main DataFrame containing the thermal zones of interest
-        - rest: DataFrame containing all other polygons (i.e. shading and those from other BIs)
-    """
-    gdf = _load_gdf(df)
-    rest_gdf = _load_gdf(rest)
-    if shading_buffer_radius != '':
-    
-        # Buffer the df geometry to specified radius for shading
-        dissolved = gdf.dissolve().geometry.convex_hull.buffer(shading_buffer_radius)
-
-        # Find polygons which are within this buffer and create mask
-        mask = rest_gdf.intersects(dissolved[0])
-        
-        # Get data for the polygons within the buffer
-        within_buffer = rest.loc[mask].copy()
-
-        # Set them to be shading
-        within_buffer["shading"] = True
-    
-    else:
-        # All other buildings are to be included as shading
-        within_buffer = rest.copy()
-        within_buffer["shading"] = True
+        polygons: np.ndarray
+        ) -> Polygon:
+    """
+    Returns the convex hull of the polygons, buffered by the shading 
+    buffer radius. The buffer resolution matches that of geopandas.
+    """
+    return shp.buffer(
+        shp.convex_hull(shp.union_all(polygons)),
+        shading_buffer_radius, quad_segs=16
+        )
 
-    # Include them in the idf
-    #df = pd.concat([df, within_buffer])
 
-    return within_buffer
+def _shading_buffer_rows(
+        shading_buffer_radius: Union[float, int],
+        polygons: np.ndarray,
+        tree: shp.STRtree
+        ) -> np.ndarray:
+    """
+    Returns the sorted positions of the geometries in the spatial 
+    index tree that intersect the buffered convex hull of polygons.
+    """
+    hull = _shading_hull(shading_buffer_radius, polygons)
+    return np.sort(tree.query(hull, predicate="intersects"))
 
 
 def _orientate(poly: Polygon) -> Polygon:
@@ -109,12 +96,23 @@ def _orientate(poly: Polygon) -> Polygon:
     return Polygon(ext_coords, int_ring)
 
 
-def _is_exterior_ccw(poly: Polygon) -> bool:
+def _orientate_array(polygons: np.ndarray) -> np.ndarray:
     """
-    Function to determine whether a polgon's
-    exterior is anti-clockwise.
+    Vectorised version of :func:`_orientate` for an array of
+    polygons. The rings that are wrongly orientated are reversed
+    in one call and the polygons rebuilt from their rings.
     """
-    return poly.exterior.is_ccw
+    rings, ring_owner = shp.get_rings(polygons, return_index=True)
+
+    # The first ring of each polygon is its exterior
+    exterior = np.ones(ring_owner.__len__(), dtype=bool)
+    exterior[1:] = ring_owner[1:] != ring_owner[:-1]
+    flip = shp.is_ccw(rings) == exterior
+    rings[flip] = shp.reverse(rings[flip])
+    return shp.polygons(
+        rings, indices=ring_owner,
+        out=np.empty(polygons.__len__(), dtype=object)
+        )
 
 
 def _remove_duplicate_coords(poly: Polygon) -> Polygon:
@@ -133,23 +131,6 @@ def _remove_duplicate_coords(poly: Polygon) -> Polygon:
     return Polygon(ext_ring_no_dup, int_ring_no_dup_list)
 
 
-def _is_touching(poly1: Polygon, poly2: Polygon) -> bool:
-    """
-    Function to determine if polygon 1 touches
-    polygon 2. A ValueError is raised if the
-    polygons interect rather than touch.
-    """
-    touches = poly1.touches(poly2)
-    intersects = poly1.intersects(poly2)
-    if not poly1.intersection(poly2).geom_type not in ['Point']:
-        return False
-    if intersects and not touches:
-        raise ValueError
-    if touches:
-        return True
-    return False
-
-
 def _has_interior(poly: Polygon) -> bool:
     """
     Function to determine whether a polygon
@@ -177,7 +158,66 @@ def _poly_tol(poly: Polygon, tol: float) -> bool:
     return False
 
 
-# Could simplify
+def _touches_and_is_point(
+        polygons1: np.ndarray,
+        polygons2: np.ndarray
+        ) -> tuple:
+    """
+    Function that, for each pair of polygons polygons1[k] and 
+    polygons2[k], determines whether they touch and whether
+    their intersection is a single point. Returns a tuple
+    of two boolean arrays.
+    """
+    touches = shp.touches(polygons1, polygons2)
+    is_point = shp.get_type_id(
+        shp.intersection(polygons1, polygons2)
+        ) == shp.GeometryType.POINT
+    return touches, is_point
+
+
+def _ring_coordinates(polygons: np.ndarray) -> tuple:
+    """
+    Function to flatten the rings of an array of polygons into
+    a structure of arrays: contiguous x and y coordinate arrays,
+    an offsets array such that the coordinates of ring i are
+    x[offsets[i]:offsets[i+1]], and an array giving the index
+    of the polygon that owns each ring.
+    """
+    if len(polygons) == 0:
+        empty = np.empty(0, dtype=np.float64)
+        return empty, empty, np.zeros(1, dtype=np.intp), np.empty(0, dtype=np.intp)
+
+    # The ragged array layout gives the coordinates and ring offsets
+    # directly, without creating a geometry object for each ring
+    _, coords, (offsets, poly_offsets) = shp.to_ragged_array(
+        polygons, include_z=False
+        )
+    ring_owner = np.repeat(np.arange(len(polygons)), np.diff(poly_offsets))
+    x = np.ascontiguousarray(coords[:, 0])
+    y = np.ascontiguousarray(coords[:, 1])
+    return x, y, offsets, ring_owner
+
+
+def _polys_within_tol(polygons: np.ndarray, tol: float) -> np.ndarray:
+    """
+    Vectorised version of _poly_tol acting on an array of 
+    polygons. The distances between consecutive points are 
+    computed over the flattened coordinates of all rings in 
+    one pass. Returns a boolean array that is True for 
+    polygons with coordinates closer together than tol.
+    """
+    x, y, offsets, ring_owner = _ring_coordinates(polygons)
+    dx, dy = np.diff(x), np.diff(y)
+    too_close = np.sqrt(dx*dx + dy*dy) < tol
+
+    # Ignore the differences that span two rings
+    too_close[offsets[1:-1] - 1] = False
+    coord_ring = np.repeat(np.arange(len(ring_owner)), np.diff(offsets))
+    flagged = np.zeros(len(polygons), dtype=bool)
+    flagged[ring_owner[coord_ring[:-1][too_close]]] = True
+    return flagged
+
+
 def _poly_is_not_valid(poly: Polygon) -> bool:
     """
     Function to determine whether a polygon
@@ -185,13 +225,33 @@ def _poly_is_not_valid(poly: Polygon) -> bool:
     intersect with the exterior. 
     This function returns True if so.
     """
+    n_holes = shp.get_num_interior_rings(poly)
+    if n_holes == 0:
+        return False
+
+    # The exterior is tested against every hole, so prepare it once
     ex = LinearRing(poly.exterior)
-    for inner in poly.interiors:
-        in_i = Polygon(inner.coords)
-        if not ex.touches(in_i):
-            if ex.intersects(in_i):
-                return True
-    return False
+    shp.prepare(ex)
+    inners = shp.polygons(shp.get_interior_ring(poly, np.arange(n_holes)))
+    return bool(
+        (~shp.touches(ex, inners) & shp.intersects(ex, inners)).any()
+        )
+
+
+def _exterior_coords_difference(poly1: Polygon, poly2: Polygon) -> list:
+    """
+    Function that returns the (unique) coordinates of poly1's 
+    exterior that are not in poly2's exterior, as a list 
+    of tuples.
+    """
+    xy_dtype = np.dtype([('x', np.float64), ('y', np.float64)])
+    coords1 = np.ascontiguousarray(
+        shp.get_coordinates(poly1.exterior)
+        ).view(xy_dtype).ravel()
+    coords2 = np.ascontiguousarray(
+        shp.get_coordinates(poly2.exterior)
+        ).view(xy_dtype).ravel()
+    return np.setdiff1d(coords1, coords2).tolist()
 
 
 def _buffered_polygon(
@@ -299,15 +359,28 @@ def _update_exposed(exposed_ring, points_to_remove):
 
 
 # Could be improved
-def _remove_collinear_points_horizontal(poly: Polygon) -> Polygon:
+def _rings_union(poly: Polygon) -> Union[LineString, MultiLineString]:
     """
-    Function that takes a new polygon and returns it
-    with all collinear points removed.
+    Function that returns the union of a polygon's
+    exterior and interior rings.
     """
-    coll_list = list()
     o_r = LineString(poly.exterior)
     i_r = MultiLineString(poly.interiors)
-    t_t = unary_union((o_r, i_r))
+    return unary_union((o_r, i_r))
+
+
+def _remove_collinear_points_horizontal(
+        poly: Polygon,
+        t_t: Union[LineString, MultiLineString] = None
+        ) -> Polygon:
+    """
+    Function that takes a new polygon and returns it
+    with all collinear points removed. The union of
+    its rings, t_t, is computed if not given.
+    """
+    coll_list = list()
+    if t_t is None:
+        t_t = _rings_union(poly)
     if t_t.geom_type == 'MultiLineString':
         for item in list(t_t.geoms):
             coords = list(item.coords)
@@ -379,3 +452,96 @@ def _surface_coordinates(poly: Polygon, origin) -> list:
 
 
 
+
+
+def _dedupe_ring_coordinates(
+        coords: np.ndarray,
+        ring_index: np.ndarray
+        ) -> tuple:
+    """
+    Function to remove duplicated coordinates from flattened
+    ring coordinates, as returned by ``shapely.get_coordinates``
+    with ``return_index=True``. Within each ring only the first 
+    occurrence of each coordinate is kept, and the ring is then 
+    closed again. Returns the coordinates and ring indices, 
+    ordered by ring.
+    """
+    # Sort the coordinates by ring, then by value, keeping the
+    # original order for ties so that the first occurrence 
+    # of a repeated coordinate comes first
+    order = np.lexsort((
+        np.arange(ring_index.__len__()), coords[:, 1], coords[:, 0],
+        ring_index
+        ))
+    s_coords, s_ring = coords[order], ring_index[order]
+    repeated = np.zeros(ring_index.__len__(), dtype=bool)
+    repeated[1:] = (
+        (s_ring[1:] == s_ring[:-1])
+        & (s_coords[1:, 0] == s_coords[:-1, 0])
+        & (s_coords[1:, 1] == s_coords[:-1, 1])
+        )
+    keep = np.empty_like(repeated)
+    keep[order] = ~repeated
+
+    # Close each ring again with its first coordinate
+    first = np.flatnonzero(np.r_[True, ring_index[1:] != ring_index[:-1]])
+    coords = np.concatenate((coords[keep], coords[first]))
+    ring_index = np.concatenate((ring_index[keep], ring_index[first]))
+    order = np.argsort(ring_index, kind="stable")
+    return coords[order], ring_index[order]
+
+
+def _remove_duplicate_coords_array(polygons: np.ndarray) -> np.ndarray:
+    """
+    Vectorised version of :func:`_remove_duplicate_coords` for an 
+    array of polygons. Within each ring only the first occurrence 
+    of each coordinate is kept, and the ring is then closed again.
+    """
+    rings, ring_owner = shp.get_rings(polygons, return_index=True)
+    coords, ring_index = _dedupe_ring_coordinates(
+        *shp.get_coordinates(rings, return_index=True)
+        )
+    new_rings = shp.linearrings(coords, indices=ring_index)
+    return shp.polygons(
+        new_rings, indices=ring_owner,
+        out=np.empty(polygons.__len__(), dtype=object)
+        )
+
+
+def _orientate_dedupe_and_tol(polygons: np.ndarray, tol: float) -> tuple:
+    """
+    Function that combines :func:`_orientate_array`, 
+    :func:`_remove_duplicate_coords_array` and :func:`_polys_within_tol`
+    into a single pass over the rings of an array of polygons. The
+    rings are only extracted once and the polygons only rebuilt once.
+    Returns the new polygons, and a boolean array that is True for
+    polygons with coordinates closer together than tol.
+    """
+    rings, ring_owner = shp.get_rings(polygons, return_index=True)
+
+    # Orientate the rings, the first ring of each 
+    # polygon being its exterior
+    exterior = np.ones(ring_owner.__len__(), dtype=bool)
+    exterior[1:] = ring_owner[1:] != ring_owner[:-1]
+    flip = shp.is_ccw(rings) == exterior
+    rings[flip] = shp.reverse(rings[flip])
+
+    # Remove the duplicate coordinates
+    coords, ring_index = _dedupe_ring_coordinates(
+        *shp.get_coordinates(rings, return_index=True)
+        )
+
+    # Flag polygons with consecutive coordinates closer together 
+    # than tol, ignoring the differences that span two rings
+    d = np.diff(coords, axis=0)
+    too_close = np.sqrt(d[:, 0]*d[:, 0] + d[:, 1]*d[:, 1]) < tol
+    too_close &= ring_index[1:] == ring_index[:-1]
+    flagged = np.zeros(polygons.__len__(), dtype=bool)
+    flagged[ring_owner[ring_index[:-1][too_close]]] = True
+
+    new_rings = shp.linearrings(coords, indices=ring_index)
+    new_polygons = shp.polygons(
+        new_rings, indices=ring_owner,
+        out=np.empty(polygons.__len__(), dtype=object)
+        )
+    return new_polygons, flagged
@@ -13,8 +13,7 @@ from shapely.geometry import Polygon
 from shapely.ops import unary_union
 import simstock._algs._coords_algs as calgs
 import simstock._algs._polygon_algs as algs
-from ast import literal_eval
-from pandas.core.frame import DataFrame
+import numpy as np
 
 # Should be redundant -- test this
 tolerance = 0.1
@@ -75,59 +74,61 @@ def _simplification_affects_inner_ring(
 
 
 def _remove_hole_if_inner_is_removed(
-                df: DataFrame,
+                polygons: np.ndarray,
+                holes: np.ndarray,
                 inner_polygon: Polygon,
-                polygon_within_hole
-                ) -> DataFrame:
+                polygon_within_hole,
+                osgb_index: dict
+                ) -> None:
             """
             Function to remove hole within each 
-            polygon in the data frame if their
+            polygon in the polygons array if their
             inner polygons are removed.
             """
             for p in polygon_within_hole:
-                p_polygon = df.loc[
-                    df['osgb'] == p, 'polygon'
-                    ].values[0]
+                p_row = osgb_index[p]
+                p_polygon = polygons[p_row]
                 if p_polygon:
                     if inner_polygon.contains(p_polygon):
-                        df.loc[df['osgb'] == p, 'polygon'] = False
-                        p_polygon_within_hole = literal_eval(
-                            df.loc[df['osgb'] == p,
-                                    'polygon_within_hole'].values[0])
+                        polygons[p_row] = None
+                        p_polygon_within_hole = holes[p_row]
                         if p_polygon_within_hole:
-                            df = _remove_holes(
-                                df, p_polygon_within_hole)
-            return df
+                            _remove_holes(
+                                polygons, holes, p_polygon_within_hole,
+                                osgb_index)
 
 
 def _remove_holes(
-        df: DataFrame,
-        polygon_within_hole
-        ) -> DataFrame:
+        polygons: np.ndarray,
+        holes: np.ndarray,
+        polygon_within_hole,
+        osgb_index: dict
+        ) -> None:
         """
         Recursive function to remove holes from 
-        polygons in the dataframe df.
+        polygons in the polygons array.
         """
         if polygon_within_hole:
             for p in polygon_within_hole:
-                p_polygon = df.loc[df['osgb'] ==
-                                    p, 'polygon'].values[0]
-                p_polygon_within_hole = literal_eval(
-                    df.loc[df['osgb'] == p, 'polygon_within_hole'].values[0])
+                p_row = osgb_index[p]
+                p_polygon = polygons[p_row]
+                p_polygon_within_hole = holes[p_row]
                 if p_polygon and p_polygon_within_hole:
-                    df = _remove_holes(df, p_polygon_within_hole)
-                df.loc[df['osgb'] == p, 'polygon'] = False
-        return df
+                    _remove_holes(
+                        polygons, holes, p_polygon_within_hole, osgb_index)
+                polygons[p_row] = None
 
 
 def _not_valid_polygons(
         osgb: str,
         polygon: Polygon,
-        df: DataFrame,
+        polygons: np.ndarray,
+        holes: np.ndarray,
         outer_coords: list,
         polygon_within_hole: Polygon,
-        remove_leave_pairs
-        ):
+        remove_leave_pairs,
+        osgb_index: dict
+        ) -> Polygon:
     """
     Recursive function that attempts to rectify polygons where
     their interiors are intersecting with their exteriors. This
@@ -151,9 +152,8 @@ def _not_valid_polygons(
                     if len(new_inner_coords) > 3:
                         if polygon_within_hole:
                             for p in polygon_within_hole:
-                                p_polygon = df.loc[
-                                    df['osgb'] == p, 'polygon'
-                                    ].values[0]
+                                p_row = osgb_index[p]
+                                p_polygon = polygons[p_row]
                                 if p_polygon:
                                     if inner_polygon.contains(p_polygon):
                                         p_outer_coords = list(
@@ -177,18 +177,16 @@ def _not_valid_polygons(
                                             if p_polygon.interiors:
                                                 new_p_polygon = Polygon(
                                                     p_outer_coords, p_polygon.interiors)
-                                                p_polygon_within_hole = literal_eval(
-                                                    df.loc[df['osgb'] == p, 'polygon_within_hole'].values[0])
+                                                p_polygon_within_hole = holes[p_row]
                                                 mock_list = list()
-                                                df, new_p_polygon = _not_valid_polygons(
-                                                    p, new_p_polygon, df, p_outer_coords, p_polygon_within_hole, mock_list)
+                                                new_p_polygon = _not_valid_polygons(
+                                                    p, new_p_polygon, polygons, holes, p_outer_coords, p_polygon_within_hole, mock_list, osgb_index)
                                             else:
                                                 new_p_polygon = Polygon(
                                                     p_outer_coords)
-                                            df.loc[df['osgb'] == p, 'polygon'] = new_p_polygon
+                                            polygons[p_row] = new_p_polygon
                                         else:
-                                            df.loc[df['osgb'] == p,
-                                                    'polygon'] = False
+                                            polygons[p_row] = None
                         else:
                             mock_list = list()
                             new_inner_coords, _ = _simplified_coords(
@@ -199,29 +197,38 @@ def _not_valid_polygons(
                             eroded_inner_list.append(
                                 new_inner_coords)
                     elif polygon_within_hole:
-                        df = _remove_hole_if_inner_is_removed(
-                            df, inner_polygon, polygon_within_hole)
+                        _remove_hole_if_inner_is_removed(
+                            polygons, holes, inner_polygon,
+                            polygon_within_hole, osgb_index)
                 elif polygon_within_hole:
-                    df = _remove_hole_if_inner_is_removed(
-                        df, inner_polygon, polygon_within_hole)
+                    _remove_hole_if_inner_is_removed(
+                        polygons, holes, inner_polygon,
+                        polygon_within_hole, osgb_index)
         polygon = Polygon(outer_coords, eroded_inner_list)
-    return df, polygon
+    return polygon
 
 
 # This can all be simplified
 def _polygon_simplifying(
-        polygon: Polygon,
-        df: DataFrame,
+        polygons: np.ndarray,
+        holes: np.ndarray,
         osgb: str,
-        osgb_touching: str
-        ) -> DataFrame:
+        osgb_touching: list,
+        osgb_index: dict
+        ) -> None:
     """
     Function that attempts to simplify a polygon by applying
     simplification rules to its exterior and interior components.
     Various checks are algorithms are then applied to handle cases
     where simplifications lead to unexpected intersections.
+
+    ``polygons`` and ``holes`` hold the polygon and 
+    ``poly_within_hole`` values of each row, and are updated in 
+    place. ``osgb_index`` maps each osgb to its row position.
     """
-    polygon_within_hole = df.loc[df['osgb'] == osgb, 'poly_within_hole'].values[0]
+    row = osgb_index[osgb]
+    polygon = polygons[row]
+    polygon_within_hole = holes[row]
     rlp = list()
     outer_coords, rlp = _simplified_coords(polygon, 'outer', rlp)
     if len(outer_coords) > 3:
@@ -230,29 +237,24 @@ def _polygon_simplifying(
                 polygon, 'inner', rlp)
             new_polygon = Polygon(outer_coords, inner_coords_list)
             if not inner_coords_list:
-                df = _remove_holes(df, polygon_within_hole)
-            df, new_polygon = _not_valid_polygons(
-                osgb, new_polygon, df, outer_coords,
-                polygon_within_hole, rlp)
+                _remove_holes(polygons, holes, polygon_within_hole, osgb_index)
+            new_polygon = _not_valid_polygons(
+                osgb, new_polygon, polygons, holes, outer_coords,
+                polygon_within_hole, rlp, osgb_index)
         else:
             new_polygon = Polygon(outer_coords)
-        df.loc[
-            df['osgb'] == osgb, 'polygon'
-            ] = new_polygon
+        polygons[row] = new_polygon
     else:
-        df.loc[df['osgb'] == osgb, 'polygon'] = False
-        df = _remove_holes(df, polygon_within_hole)
+        polygons[row] = None
+        _remove_holes(polygons, holes, polygon_within_hole, osgb_index)
 
     if rlp and osgb_touching:
         for t in osgb_touching:
-            t_polygon = df.loc[df['osgb'] == t, 'polygon'].values[0]
+            t_row = osgb_index[t]
+            t_polygon = polygons[t_row]
             if t_polygon:
-                t_polygon_within_hole = df.loc[
-                    df['osgb'] == t, 'poly_within_hole'
-                    ].values[0]
-                osgb_polygon = df.loc[
-                    df['osgb'] == osgb, 'polygon'
-                    ].values[0]
+                t_polygon_within_hole = holes[t_row]
+                osgb_polygon = polygons[row]
                 if osgb_polygon and t_polygon_within_hole and (osgb in t_polygon_within_hole):
                     t_polygon = _simplification_affects_inner_ring(
                         t_polygon, polygon, rlp)
@@ -263,13 +265,13 @@ def _polygon_simplifying(
                     if t_polygon.interiors:
                         t_polygon = Polygon(t_outer_coords,
                                             t_polygon.interiors)
-                        df, t_polygon = _not_valid_polygons(
-                            t, t_polygon, df, t_outer_coords,
-                            t_polygon_within_hole, rlp)
+                        t_polygon = _not_valid_polygons(
+                            t, t_polygon, polygons, holes, t_outer_coords,
+                            t_polygon_within_hole, rlp, osgb_index)
                     else:
                         t_polygon = Polygon(t_outer_coords)
-                    df.loc[df['osgb'] == t, 'polygon'] = t_polygon
+                    polygons[t_row] = t_polygon
                 else:
-                    df.loc[df['osgb'] == t, 'polygon'] = False
-                    df = _remove_holes(df, t_polygon_within_hole)
-    return df
\ No newline at end of file
+                    polygons[t_row] = None
+                    _remove_holes(
+                        polygons, holes, t_polygon_within_hole, osgb_index)
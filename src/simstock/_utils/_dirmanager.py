@@ -5,10 +5,27 @@ Mostly used to allow users to create and modify csv files for settings
 
 import os
 import shutil
+from typing import Union
+from concurrent.futures import ThreadPoolExecutor
 from eppy.modeleditor import IDF
 import pandas as pd
 
 
+# Text columns shared by the settings csv files. Reading these as
+# strings up front spares pandas the type inference and stops
+# numeric-looking names from being turned into numbers
+_SETTINGS_CSV_DTYPES = dict.fromkeys(
+    (
+        "Name",
+        "Notes",
+        "Schedule_Type_Limits_Name",
+        "Zone_or_ZoneList_Name",
+        "Schedule_Name",
+    ),
+    str
+)
+
+
 def _copy_directory_contents(
         source_dir: str,
         destination_dir: str
@@ -43,15 +60,16 @@ def _delete_directory_contents(directory_path: str) -> None:
     Recursively removes contents of directory_path
     """
     try:
-        # Remove all the contents of the directory
-        for item in os.listdir(directory_path):
-            item_path = os.path.join(directory_path, item)
-            if os.path.isdir(item_path):
-                # If the item is a subdirectory, recursively delete its contents
-                _delete_directory_contents(item_path)
-            else:
-                # If the item is a file, remove it
-                os.remove(item_path)
+        # Remove all the contents of the directory. The entries from
+        # scandir already know their type, saving a stat per item
+        with os.scandir(directory_path) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    # If the item is a subdirectory, recursively delete its contents
+                    _delete_directory_contents(entry.path)
+                else:
+                    # If the item is a file, remove it
+                    os.remove(entry.path)
 
     except Exception as e:
         print(f"Error while deleting: {e}")
@@ -76,12 +94,12 @@ def _extract_class_name(file_name: str) -> str:
 
 def _add_or_modify_idfobject(
         classname: str,
-        row: pd.Series,
+        row: dict,
         idf: IDF
         ) -> None:
     """
-    Function used to take a row of a csv (pandas Dataframe), 
-    and create an IDF object out of it
+    Function used to take a row of a csv (as a dict mapping
+    column names to values), and create an IDF object out of it
     """
 
     # Turn row into a nice dictionary
@@ -90,22 +108,43 @@ def _add_or_modify_idfobject(
         if not pd.isna(val) and val != ",":
             d[key] = val
 
-    # Check if this thing already exists 
-    # in the idf object
-    duplicate_count = 0
-    for ind, item in enumerate(idf.idfobjects[classname]):
-        if item.Name == d["Name"]:
-            duplicate_count += 1
-    if duplicate_count > 0:
-        for _ in range(duplicate_count):
-            for ind, item in enumerate(idf.idfobjects[classname]):
-                if item.Name == d["Name"]:
-                    idf.popidfobject(classname, ind)
-                    break
+    # Remove any objects of the same name that already 
+    # exist in the idf object. Pop from the end so that 
+    # the remaining indices stay valid
+    duplicates = [
+        ind for ind, item in enumerate(idf.idfobjects[classname])
+        if item.Name == d["Name"]
+    ]
+    for ind in reversed(duplicates):
+        idf.popidfobject(classname, ind)
 
     idf.newidfobject(classname, **d)
 
 
+def _read_settings_csv(fname: str) -> Union[pd.DataFrame, None]:
+    """
+    Function to load a settings csv file as a pandas
+    dataframe. None is returned if it cannot be loaded.
+    """
+    try:
+        na_values = ["", "N/A", "NA", "NaN", "NULL", "None"]
+        return pd.read_csv(
+            fname,
+            dtype=_SETTINGS_CSV_DTYPES,
+            na_values=na_values,
+            on_bad_lines='skip'
+            )
+    except FileNotFoundError:
+        print(f"File '{fname}' not found.")
+    except pd.errors.EmptyDataError:
+        print(f"File '{fname}' is empty.")
+    except pd.errors.ParserError as pe:
+        print(f"Error parsing '{fname}': {pe}")
+    except Exception as e:
+        print(f"An error occurred while loading '{fname}': {e}")
+    return None
+
+
 
 def _compile_csvs_to_idf(idf: IDF, path: str) -> None:
     """
@@ -113,46 +152,43 @@ def _compile_csvs_to_idf(idf: IDF, path: str) -> None:
     contents. It uses to rows of the csv files to create IDF objects
     that are then added to idf
     """
-    
-    for csv_file in os.listdir(path):
-        if csv_file.endswith(".csv"):
-
-            # Get idf class name
-            idf_class = _extract_class_name(csv_file[:-4])
-            if idf_class != "OnOff":
-
-                # load as pandas dataframe
-                try:
-                    na_values = ["", "N/A", "NA", "NaN", "NULL", "None"]
-                    df = pd.read_csv(
-                        os.path.join(path, csv_file),
-                        na_values=na_values,
-                        on_bad_lines='skip'
-                        )
-                except FileNotFoundError:
-                    print(f"File '{csv_file}' not found.")
-                except pd.errors.EmptyDataError:
-                    print(f"File '{csv_file}' is empty.")
-                except pd.errors.ParserError as pe:
-                    print(f"Error parsing '{csv_file}': {pe}")
-                except Exception as e:
-                    print(f"An error occurred while loading '{csv_file}': {e}")
-
-                # Iterate over rows of df
-                for _, row in df.iterrows():
-
-                    # Add each entry as a new idf object
-                    try:
-                        _add_or_modify_idfobject(idf_class, row, idf)
-                    except Exception as e:
-                        print(e)
-                        print(f"Cause: class {idf_class}")
-                        # for item in row.items():
-                        #     print(item)
-                        raise Exception from e
+
+    # Get the idf class name of each csv file
+    csv_files = [f for f in os.listdir(path) if f.endswith(".csv")]
+    idf_classes = [_extract_class_name(f[:-4]) for f in csv_files]
+    csv_files = [
+        os.path.join(path, f) 
+        for f, c in zip(csv_files, idf_classes) if c != "OnOff"
+        ]
+    idf_classes = [c for c in idf_classes if c != "OnOff"]
+
+    # Load them as pandas dataframes. Reading is I/O bound,
+    # so the files are read concurrently
+    with ThreadPoolExecutor() as executor:
+        dfs = list(executor.map(_read_settings_csv, csv_files))
+
+    for idf_class, df in zip(idf_classes, dfs):
+        if df is None:
+            continue
+
+        # Iterate over rows of df
+        for values in df.itertuples(index=False, name=None):
+
+            # Add each entry as a new idf object
+            try:
+                row = dict(zip(df.columns, values))
+                _add_or_modify_idfobject(idf_class, row, idf)
+            except Exception as e:
+                print(e)
+                print(f"Cause: class {idf_class}")
+                raise Exception from e
 
     # Then handle the on/off thing
-    df = pd.read_csv(os.path.join(path, "DB-HeatingCooling-OnOff.csv"))
+    df = pd.read_csv(
+        os.path.join(path, "DB-HeatingCooling-OnOff.csv"),
+        usecols=["Heating_Cooling"],
+        nrows=1
+        )
     heatcool = df["Heating_Cooling"].iloc[0]
     if not heatcool:
         thermostats = idf.idfobjects["ThermostatSetpoint:DualSetpoint"]
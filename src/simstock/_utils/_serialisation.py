@@ -14,6 +14,7 @@ import geopandas as gpd
 import numpy as np
 import pandas as pd
 from pandas.core.frame import DataFrame
+import shapely as shp
 from shapely import wkt
 from shapely.errors import GEOSException
 from shapely.geometry.base import BaseGeometry
@@ -36,14 +37,37 @@ def _assert_bool(val: Union[bool, str]) -> bool:
     Function to ensure that a bool value that has been
     wrongly encoded as a string is re-encoded back as a bool.
     """
-    if type(val) == bool:
-        return val
+    if isinstance(val, (bool, np.bool_)):
+        return bool(val)
     if val == "false" or val == "False":
         return False
     if val == "true" or val == "True":
         return True
 
 
+# The values accepted by _assert_bool, used to convert a whole
+# column at once rather than calling _assert_bool element-wise
+_BOOL_VALUES = {
+    True: True,
+    False: False,
+    "true": True,
+    "True": True,
+    "false": False,
+    "False": False
+}
+
+
+def _bool_series(series: pd.Series) -> pd.Series:
+    """
+    Function to apply :func:`_assert_bool` to a whole series. Values
+    that cannot be interpreted as bools become NaN. Series that 
+    are already of bool dtype are returned unchanged.
+    """
+    if pd.api.types.is_bool_dtype(series):
+        return series
+    return series.map(_BOOL_VALUES)
+
+
 def _generate_unique_string() -> str:
     timestamp = datetime.datetime.now().strftime('%Y%m%d%H%M%S')
     return f"{timestamp}"
@@ -97,24 +121,57 @@ def _geoserialise_pdseries(dat: pd.Series) -> pd.Series:
     """
     Check if pandas Series data is shapely-geometry type.
     """
-    return dat.apply(_shapely_loader) #(dat.values)
+    return pd.Series(
+        _geoserialise_values(dat.to_numpy(dtype=object)),
+        index=dat.index,
+        name=dat.name
+        )
 
 
 def _geoserialise_array(arr):
     """
     Check if array is shapely-geometry type.
     """
-    return [_shapely_loader(val) for val in arr]
+    values = np.empty(len(arr), dtype=object)
+    values[:] = list(arr)
+    return list(_geoserialise_values(values))
+
+
+def _geoserialise_values(values: np.ndarray) -> np.ndarray:
+    """
+    Vectorised version of :func:`_shapely_loader` acting on an 
+    object array. All of the wkt values are loaded in one call.
+    """
+    out = values.copy()
+    missing = pd.isna(values)
+    out[missing] = None
+    to_load = ~(shp.is_geometry(values) | missing)
+    if to_load.any():
+        wkts = values[to_load]
+        if not all(isinstance(v, (str, bytes)) for v in wkts):
+            raise TypeError(
+                "Data is neither any form of geometry data nor NaN"
+            )
+        try:
+            out[to_load] = shp.from_wkt(wkts)
+        except GEOSException as exc:
+            raise TypeError(
+                "Data is neither any form of geometry data nor NaN"
+            ) from exc
+    return out
 
 
 def _shapely_loader(obj):
     """
-    Checks if object is geomtry-like.
+    Checks if object is geomtry-like. Missing values are
+    returned as None, which shapely's vectorised functions 
+    treat as a missing geometry (unlike pd.NA, which they
+    reject).
     """
     if isinstance(obj, BaseGeometry):
         return obj
     if _isna(obj):
-        return pd.NA
+        return None
     if _is_wkt(obj):
         return wkt.loads(obj)
     raise TypeError(
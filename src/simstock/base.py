@@ -5,29 +5,33 @@ Module containing the base simstock objects:
 """
 
 import os
+import io
 import shutil
-import json
-import inspect
-import copy
-import glob
+try:
+    # Faster json decoding, if available
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+import re
+import fnmatch
+from ast import literal_eval
+import functools
+import importlib.util
 import numpy as np
-from typing import Any, Union
+from typing import Any, Callable, Union
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 import platform
 import itertools
 import pandas as pd
 from pandas.core.frame import DataFrame
+import geopandas as gpd
 import shapely as shp
-from shapely.geometry import (
-    Polygon,
-    LineString, 
-    MultiLineString
-)
 from shapely.ops import unary_union, linemerge
 from eppy.modeleditor import IDF
 from eppy.bunch_subclass import EpBunch
 from simstock._utils._serialisation import (
     _series_serialiser,
-    _assert_bool,
+    _bool_series,
     _generate_unique_string
 )
 from simstock._utils._exceptions import SimstockException
@@ -41,6 +45,167 @@ from simstock._utils._dirmanager import (
 )
 
 
+# Directory containing the simstock package
+_SIMSTOCK_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Default settings files
+_SETTINGS_DIR = os.path.join(_SIMSTOCK_DIR, "settings")
+_BASE_IDF = os.path.join(_SETTINGS_DIR, "base.idf")
+_SETTINGS_IDF = os.path.join(_SETTINGS_DIR, "settings.idf")
+_DEFAULT_EPW = os.path.join(
+    _SETTINGS_DIR,
+    "GBR_ENG_London.Wea.Ctr-St.James.Park.037700_TMYx.2007-2021.epw"
+    )
+_VENTILATION_JSON = os.path.join(_SETTINGS_DIR, "ventilation_dict.json")
+_INFILTRATION_JSON = os.path.join(_SETTINGS_DIR, "infiltration_dict.json")
+
+# Readers for the data files accepted by IDFmanager, by file extension.
+# Csv files are parsed with pyarrow's multithreaded reader, if available.
+# Parquet files already use pyarrow, if available, and otherwise 
+# fall back to fastparquet
+if importlib.util.find_spec("pyarrow") is not None:
+    _read_csv = functools.partial(pd.read_csv, engine="pyarrow")
+else:
+    _read_csv = pd.read_csv
+
+
+# Geopackages are read with pyogrio, if available, which is faster than
+# geopandas' default fiona engine
+_GPKG_ENGINE = "pyogrio" if importlib.util.find_spec("pyogrio") else None
+
+
+def _read_gpkg(path: str) -> DataFrame:
+    """
+    Function to read the first layer of a geopackage into a
+    DataFrame, with its geometries in the ``polygon`` column.
+    """
+    gdf = gpd.read_file(path, layer=0, engine=_GPKG_ENGINE)
+    df = DataFrame({col: gdf[col] for col in gdf.columns})
+    return df.rename(columns={gdf.geometry.name: "polygon"})
+
+
+_DF_READERS = {
+    ".csv": _read_csv,
+    ".gpkg": _read_gpkg,
+    ".parquet": pd.read_parquet,
+    ".feather": pd.read_feather,
+    ".json": pd.read_json,
+}
+
+
+def _bi_name(x: float, y: float) -> str:
+    """
+    Function to create a built island name from the
+    coordinates of a point within it. Dots are replaced
+    with dashes for filename compatibility.
+    """
+    bi_name = "bi_" + str(round(x, 2)) + "_" + str(round(y, 2))
+    return bi_name.replace(".", "-")
+
+
+def _list_array(n: int) -> np.ndarray:
+    """
+    Function to create an object array of n distinct empty lists,
+    for building list-valued columns such as ``touching``.
+    """
+    arr = np.empty(n, dtype=object)
+    for k in range(n):
+        arr[k] = []
+    return arr
+
+
+def _n_workers(n_jobs: int) -> int:
+    """
+    Function to get the number of workers to use from an ``n_jobs``
+    value, where -1 means all available CPUs.
+    """
+    if n_jobs == -1:
+        return os.cpu_count() or 1
+    if n_jobs >= 1:
+        return n_jobs
+    raise ValueError(
+        f"n_jobs must be -1 or a positive integer, not {n_jobs}."
+        )
+
+
+def _run_idf(
+        idf_fname: str,
+        epw: str,
+        idd_file: str,
+        output_directory: str
+        ) -> None:
+    """
+    Function to run an EnergyPlus simulation of a saved IDF file
+    in a worker process. eppy writes a temporary copy of the IDF
+    into the working directory, so each simulation is run from
+    within its own output directory.
+    """
+    IDF.setiddname(idd_file)
+    os.chdir(output_directory)
+    IDF(idf_fname, epw).run(output_directory=output_directory)
+
+
+@functools.lru_cache(maxsize=None)
+def _locate_idd(paths: tuple) -> str:
+    """
+    Function to find the EnergyPlus .idd file from a tuple of
+    install path patterns. The result is cached, so that the 
+    install locations are only searched once per session.
+    If several versions are installed, the newest is used.
+    """
+    for path in paths:
+        # Split e.g. /usr/local/EnergyPlus*/Energy+.idd into the 
+        # parent directory, the pattern matching the versioned 
+        # install directory, and the idd file name
+        install_pattern, idd_name = os.path.split(path)
+        parent, dir_pattern = os.path.split(install_pattern)
+        try:
+            with os.scandir(parent) as entries:
+                installs = [
+                    entry.path for entry in entries
+                    if fnmatch.fnmatch(entry.name, dir_pattern)
+                    and entry.is_dir()
+                ]
+        except OSError:
+            continue
+
+        # Compare version numbers numerically, so that 
+        # e.g. EnergyPlus-22-2-0 is newer than EnergyPlus-9-6-0
+        version_key = lambda x: [
+            int(s) if s.isdigit() else s for s in re.split(r"(\d+)", x)
+            ]
+        for install in sorted(installs, key=version_key, reverse=True):
+            idd_file = os.path.join(install, idd_name)
+            if os.path.isfile(idd_file):
+                return idd_file
+    raise FileNotFoundError("Could not find EnergyPlus IDD file")
+
+
+def _default_idd_file() -> str:
+    """
+    Function to get the EnergyPlus .idd file used when none has been 
+    specified: the ``IDD_FILE`` environment variable if it is set, 
+    otherwise the newest in the common install locations.
+    """
+    if os.environ.get('IDD_FILE'):
+        return os.environ.get('IDD_FILE')
+    if platform.system().casefold() == "windows":
+        paths = SimstockDataframe._common_windows_paths
+    else:
+        paths = SimstockDataframe._common_posix_paths
+    return _locate_idd(tuple(paths))
+
+
+def _copy_on_write() -> bool:
+    """
+    Whether pandas' copy-on-write mode has been enabled by the user
+    """
+    try:
+        return pd.get_option("mode.copy_on_write") is True
+    except KeyError:
+        return False
+
+
 class SimstockDataframe:
     """
     A :class:`SimstockDataframe` is an object used by Simstock to store all input data and perform the necessary geometric simplification steps to make it a compatable with EnergyPlus. It behaves the in the same way as a Pandas :class:`DataFrame`, but with some key additional methods to perform geometric-based pre-processing.
@@ -71,6 +236,9 @@ class SimstockDataframe:
     :param idd_file: *Optional* The file name, including the path, to your
         EnergyPlus .idd file. If none is specified, Simstock will look in common locations, such as ``C:\\EnergyPlus*\\`` if you are running Windows or ``/usr/local/EnergyPlus*`` or ``/Applications/EnergyPlus*`` if you are running Unix (note * will be the version number)
     :type idd_file: str
+    :param n_jobs: *Optional* The number of threads used for the
+        pairwise touching check in :py:meth:`polygon_topology`. Defaults to 1, i.e. no parallelism. Use -1 to use all available CPUs
+    :type n_jobs: int
 
     :raises SystemError: If your operating systemm is of unknown type
     :raises FileNotFoundError: If an EnergyPlus .idd file could not be found
@@ -201,6 +369,10 @@ class SimstockDataframe:
         # Perform all necessary geometric simplification steps
         sdf.preprocessing()
 
+    .. note:: \ \ 
+
+        Creating a :class:`SimstockDataframe` from another :class:`SimstockDataframe` copies its data. If pandas' copy-on-write mode is enabled (``pd.set_option("mode.copy_on_write", True)``), the data is instead shared until either object is modified.
+
     .. note:: \ \ 
 
         The :class:`SimstockDataframe` constructor creates a :class:`SimstockDataframe` from an object such as dict or Pandas :class:`DataFrame` that has been already instantiated and is in memory. To create a :class:`SimstockDataframe` from a file, see the functions :py:func:`read_csv`, :py:func:`read_json`, :py:func:`read_parquet`, and :py:func:`read_geopackage_layer`.
@@ -216,10 +388,15 @@ class SimstockDataframe:
         "/Applications/EnergyPlus*/Energy+.idd"
     ]
 
-    # Necessary data
-    _required_cols = [
-        "shading", "height", "wwr", "nofloors", "construction"
-        ]
+    # Necessary data, together with the
+    # default values used if they are missing
+    _required_cols = {
+        "shading": False,
+        "height": np.nan,
+        "wwr": np.nan,
+        "nofloors": np.nan,
+        "construction": ""
+        }
 
     def __init__(
             self,
@@ -230,6 +407,7 @@ class SimstockDataframe:
             tol: float = 0.1,
             use_base_idf: str = False,
             idd_file: str = None,
+            n_jobs: int = 1,
             **kwargs
             ) -> None:
         """
@@ -255,6 +433,10 @@ class SimstockDataframe:
         #:
         self.tol: float = tol 
 
+        #: The number of threads used for the pairwise touching
+        #: check in polygon_topology. Use -1 for all available CPUs.
+        self.n_jobs: int = n_jobs
+
         #: idd file name and full path
         if idd_file is not None:
             self._idd_file: str = idd_file
@@ -269,26 +451,24 @@ class SimstockDataframe:
             self._find_idd(opsys)
 
         # Get simstock directory
-        current_file_path = inspect.getframeinfo(inspect.currentframe()).filename
-        absolute_file_path = os.path.abspath(current_file_path)
-        self.simstock_directory = os.path.dirname(absolute_file_path)
+        self.simstock_directory = _SIMSTOCK_DIR
 
         # Set default settings
         IDF.setiddname(self._idd_file)
         if use_base_idf:
-            self.settings = IDF(
-            os.path.join(self.simstock_directory, "settings", "base.idf")
-        )
+            self.settings = IDF(_BASE_IDF)
         else:
-            self.settings = IDF(
-                os.path.join(self.simstock_directory, "settings", "settings.idf")
-            )
+            self.settings = IDF(_SETTINGS_IDF)
         self.settings_csv_path = None
+
         
         # If it is already a valid simstock dataframe
-        # then nothing further needs to be done
+        # then nothing further needs to be done. When pandas'
+        # copy-on-write mode is enabled the underlying data can
+        # be shared safely, since any later modification of 
+        # either dataframe will trigger a copy
         if isinstance(inputobject, SimstockDataframe):
-            self._df = inputobject._df.copy()
+            self._df = inputobject._df.copy(deep=not _copy_on_write())
             return
             
         # If it is not already a pandas dataframe, then
@@ -323,6 +503,9 @@ class SimstockDataframe:
         # Add any missing columns
         self._add_missing_cols()
 
+        # Use compact numpy dtypes where the data allows
+        self._set_column_dtypes()
+
         # Has pre-processing occured?
         self.processed = False
 
@@ -330,17 +513,47 @@ class SimstockDataframe:
         if epw_file:
             self.epw = epw_file
         else:
-            self.epw = os.path.join(self.simstock_directory, "settings", "GBR_ENG_London.Wea.Ctr-St.James.Park.037700_TMYx.2007-2021.epw")
+            self.epw = _DEFAULT_EPW
 
     def __getattr__(self, attr: str) -> Any:
         """
         Required function to allow user to interface
-        with underlying dataframe.
+        with underlying dataframe. This is only called once
+        the normal attribute lookup has failed.
         """
-        if attr in self.__dict__:
-            return getattr(self, attr)
+        # Guard against recursing before _df has been set,
+        # e.g. while copying or unpickling
+        if attr == "_df":
+            raise AttributeError(attr)
         return getattr(self._df, attr)
 
+    # The most commonly used dataframe attributes are forwarded
+    # directly, rather than through __getattr__ after a failed
+    # lookup on this object
+    @property
+    def columns(self) -> pd.Index:
+        return self._df.columns
+
+    @columns.setter
+    def columns(self, new_columns: Any) -> None:
+        self._df.columns = new_columns
+
+    @property
+    def index(self) -> pd.Index:
+        return self._df.index
+
+    @index.setter
+    def index(self, new_index: Any) -> None:
+        self._df.index = new_index
+
+    @property
+    def loc(self) -> Any:
+        return self._df.loc
+
+    @property
+    def iloc(self) -> Any:
+        return self._df.iloc
+
     def __getitem__(self, item: Any) -> Any:
         """
         Required function to allow user to interface
@@ -367,35 +580,86 @@ class SimstockDataframe:
         Prints concise info about this object.
         """
         return "SimstockDataframe()"
+
+    def __getstate__(self) -> dict:
+        """
+        Pickles the settings IDF as its IDF text, since eppy 
+        objects cannot be pickled directly. The cached settings
+        lookups are dropped, and rebuilt when next used.
+        """
+        state = self.__dict__.copy()
+        del state["_settings"], state["_idf_cache"]
+        state["_settings_idfstr"] = self.settings.idfstr()
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        """
+        Restores a pickled SimstockDataframe, reloading the 
+        settings IDF from its IDF text.
+        """
+        state = state.copy()
+        idfstr = state.pop("_settings_idfstr")
+        self.__dict__.update(state)
+        IDF.setiddname(self._idd_file)
+        self.settings = IDF(io.StringIO(idfstr))
     
     def _find_idd(self, system: str) -> None:
+        """
+        Function to find the EnergyPlus .idd file in the common 
+        install locations. If several versions are installed, the 
+        newest is used.
+        """
         if system == "windows":
             paths = self._common_windows_paths
         else:
             paths = self._common_posix_paths
-        for path in paths:
-            # Use glob to handle pattern matching for version number
-            matches = glob.glob(path)
-            if matches:
-                self._idd_file = matches[0]
-                break
-        if self._idd_file == None:
-            raise FileNotFoundError("Could not find EnergyPlus IDD file")
+        self._idd_file = _locate_idd(tuple(paths))
             
     @property
-    def is_exterior_ccw(self) -> list[bool]:
+    def is_exterior_ccw(self) -> np.ndarray:
         """
         True if polygon exteriors are counter-clockwise
         """
-        return self._df['polygon'].map(algs._is_exterior_ccw)
+        return shp.is_ccw(
+            shp.get_exterior_ring(self._df['polygon'].to_numpy())
+            )
     
     @property
-    def is_valid(self) -> list[bool]:
+    def is_valid(self) -> np.ndarray:
         """
         True if the polygon column's objects are valid shapely geometries
         """
-        return shp.is_valid(self._df['polygon'])
+        return shp.is_valid(self._df['polygon'].to_numpy())
     
+    def _osgb_index(self) -> dict:
+        """
+        Function to map each osgb to the position of its (first)
+        row, so that rows can be looked up without scanning
+        the whole ``osgb`` column.
+        """
+        osgbs = self._df['osgb'].to_numpy()
+        return dict(zip(osgbs[::-1], range(osgbs.__len__() - 1, -1, -1)))
+
+    def _touching_adjacency(self, osgb_index: dict) -> tuple:
+        """
+        Function to convert the ``touching`` column into a compressed
+        sparse row adjacency, so that the osgb values are only looked
+        up once. The row positions of the polygons touching row i 
+        are indices[indptr[i]:indptr[i+1]]. Osgb values that no 
+        longer have a row are skipped.
+        """
+        rows = [
+            [osgb_index[t] for t in osgb_touching if t in osgb_index]
+            for osgb_touching in self._df['touching'].to_numpy()
+            ]
+        indptr = np.zeros(rows.__len__() + 1, dtype=np.intp)
+        np.cumsum([r.__len__() for r in rows], out=indptr[1:])
+        indices = np.fromiter(
+            itertools.chain.from_iterable(rows),
+            dtype=np.intp, count=indptr[-1]
+            )
+        return indptr, indices
+
     @property
     def length(self) -> int:
         """
@@ -430,28 +694,28 @@ class SimstockDataframe:
             sdf.materials[0].Name = "some_new_name"
         
         """
-        return self.settings.idfobjects["MATERIAL"]
+        return self._idfobjects("MATERIAL")
     
     @property
     def material_nomass(self) -> list:
         """
         The list of no-mass materials (in :class:`eppy.bunch_subclass.EpBunch` format)
         """
-        return self.settings.idfobjects["MATERIAL:NOMASS"]
+        return self._idfobjects("MATERIAL:NOMASS")
     
     @property
     def window_material_glazing(self) -> list:
         """
         The list of window glazing materials (in :class:`eppy.bunch_subclass.EpBunch` format)
         """
-        return self.settings.idfobjects["WINDOWMATERIAL:GLAZING"]
+        return self._idfobjects("WINDOWMATERIAL:GLAZING")
     
     @property
     def window_material_gas(self) -> list:
         """
         The list of window gas layer materials (in :class:`eppy.bunch_subclass.EpBunch` format)
         """
-        return self.settings.idfobjects["WINDOWMATERIAL:GAS"]
+        return self._idfobjects("WINDOWMATERIAL:GAS")
     
     @property
     def constructions(self) -> list:
@@ -470,14 +734,14 @@ class SimstockDataframe:
             sdf.constructions[0].Name = "some_new_name"
         
         """
-        return self.settings.idfobjects["CONSTRUCTION"]
+        return self._idfobjects("CONSTRUCTION")
     
     @property
     def schedules(self) -> list:
         """
         The list of schedules (in :class:`eppy.bunch_subclass.EpBunch` format)
         """
-        return self.settings.idfobjects["SCHEDULE:COMPACT"]
+        return self._idfobjects("SCHEDULE:COMPACT")
     
     @property
     def simulation_control(self) -> EpBunch:
@@ -490,11 +754,11 @@ class SimstockDataframe:
         - "Run Simulation for Sizing Periods", defaults to No
         - "Run Simulation for Weather File Run Periods", defaults to Yes
         """
-        return self.settings.idfobjects["SIMULATIONCONTROL"][0]
+        return self._idfobjects("SIMULATIONCONTROL")[0]
     
     @simulation_control.setter
     def simulation_control(self, new_controls: EpBunch) -> None:
-        self.settings.idfobjects["SIMULATIONCONTROL"][0] = new_controls
+        self._idfobjects("SIMULATIONCONTROL")[0] = new_controls
     
     @property
     def building(self) -> EpBunch:
@@ -510,11 +774,11 @@ class SimstockDataframe:
         - "Maximum Number of Warmup Days", defaults to 25
         - "Minimum Number of Warmup Days", defaults to 6
         """
-        return self.settings.idfobjects["BUILDING"][0]
+        return self._idfobjects("BUILDING")[0]
     
     @building.setter
     def simulation_control(self, new_building: EpBunch) -> None:
-        self.settings.idfobjects["BUILDING"][0] = new_building
+        self._idfobjects("BUILDING")[0] = new_building
     
     @property
     def shadow_calculation(self) -> EpBunch:
@@ -527,37 +791,37 @@ class SimstockDataframe:
         - "Polygon Clipping Algorithm", defaults to "SutherlandHodgman"
         - "Sky Diffuse Mofeling Algorithm", defaults to "SimpleSkyDiffuseModeling"
         """
-        return self.settings.idfobjects["SHADOWCALCULATION"][0]
+        return self._idfobjects("SHADOWCALCULATION")[0]
     
     @shadow_calculation.setter
     def shadow_calculation(self, new_shadow_cals: EpBunch) -> None:
-        self.settings.idfobjects["SHADOWCALCULATION"][0] = new_shadow_cals
+        self._idfobjects("SHADOWCALCULATION")[0] = new_shadow_cals
     
     @property
     def inside_convection_algorithm(self) -> EpBunch:
         """
         :class:`eppy.bunch_subclass.EpBunch` object containing the inside surface convection algorithm, defaults to "TARP"
         """
-        return self.settings.idfobjects["SURFACECONVECTIONALGORITHM:INSIDE"][0]
+        return self._idfobjects("SURFACECONVECTIONALGORITHM:INSIDE")[0]
     
     @inside_convection_algorithm.setter
     def inside_convection_algorithm(
         self, new_inside_convection_alg: EpBunch
         ) -> None:
-        self.settings.idfobjects["SURFACECONVECTIONALGORITHM:INSIDE"][0] = new_inside_convection_alg
+        self._idfobjects("SURFACECONVECTIONALGORITHM:INSIDE")[0] = new_inside_convection_alg
     
     @property
     def outside_convection_algorithm(self) -> EpBunch:
         """
         :class:`eppy.bunch_subclass.EpBunch` object containing the outside surface convection algorithm, defaults to "TARP"
         """
-        return self.settings.idfobjects["SURFACECONVECTIONALGORITHM:OUTSIDE"][0]
+        return self._idfobjects("SURFACECONVECTIONALGORITHM:OUTSIDE")[0]
     
     @outside_convection_algorithm.setter
     def outside_convection_algorithm(
         self, new_outside_convection_alg: EpBunch
         ) -> None:
-        self.settings.idfobjects["SURFACECONVECTIONALGORITHM:OUTSIDE"][0] = new_outside_convection_alg
+        self._idfobjects("SURFACECONVECTIONALGORITHM:OUTSIDE")[0] = new_outside_convection_alg
     
     @property
     def heat_balance_algorithm(self) -> EpBunch:
@@ -567,22 +831,22 @@ class SimstockDataframe:
         - "Algorithm", defaults to "ConductionTransferFunction
         - "Surface Temperature Upper Limit", defaults to 200
         """
-        return self.settings.idfobjects["HEATBALANCEALGORITHM"][0]
+        return self._idfobjects("HEATBALANCEALGORITHM")[0]
     
     @heat_balance_algorithm.setter
     def heat_balance_algorithm(self, new_heat_alg: EpBunch) -> None:
-        self.settings.idfobjects["HEATBALANCEALGORITHM"][0] = new_heat_alg
+        self._idfobjects("HEATBALANCEALGORITHM")[0] = new_heat_alg
     
     @property
     def timestep(self) -> int:
         """
         The number of timesteps per hour, defaults to 4
         """
-        return self.settings.idfobjects["TIMESTEP"][0].Number_of_Timesteps_per_Hour
+        return self._idfobjects("TIMESTEP")[0].Number_of_Timesteps_per_Hour
     
     @timestep.setter
     def timestep(self, new_timestep: int) -> None:
-        self.settings.idfobjects["TIMESTEP"][0].Number_of_Timesteps_per_Hour = new_timestep
+        self._idfobjects("TIMESTEP")[0].Number_of_Timesteps_per_Hour = new_timestep
     
     @property
     def run_period(self) -> EpBunch:
@@ -602,18 +866,18 @@ class SimstockDataframe:
         - "Use Weather File Snow Indicators", defaults to "Yes"
         - "Number of Times Runperiod to be Repeated", defaults to 1
         """
-        return self.settings.idfobjects["RUNPERIOD"][0]
+        return self._idfobjects("RUNPERIOD")[0]
     
     @run_period.setter
     def run_period(self, new_run_period: EpBunch) -> None:
-        self.settings.idfobjects["RUNPERIOD"][0] = new_run_period
+        self._idfobjects("RUNPERIOD")[0] = new_run_period
     
     @property
     def schedule_type_limits(self) -> list:
         """
         List of :class:`eppy.bunch_subclass.EpBunch` objects containing schedule type limits
         """
-        return self.settings.idfobjects["SCHEDULETYPELIMITS"]
+        return self._idfobjects("SCHEDULETYPELIMITS")
     
     @property
     def schedule_constant(self) -> EpBunch:
@@ -624,76 +888,101 @@ class SimstockDataframe:
         - "Schedule Type Limits Name", defaults to "Control Type"
         - "Hourly Value", defauts to 4 
         """
-        return self.settings.idfobjects["SCHEDULE:CONSTANT"][0]
+        return self._idfobjects("SCHEDULE:CONSTANT")[0]
     
     @schedule_constant.setter
     def schedule_constant(self, new_schedule_constant: EpBunch) -> None:
-        self.settings.idfobjects["SCHEDULE:CONSTANT"][0] = new_schedule_constant
+        self._idfobjects("SCHEDULE:CONSTANT")[0] = new_schedule_constant
     
     @property
     def people(self) -> list:
         """
         The list of people types (in :class:`eppy.bunch_subclass.EpBunch` format)
         """
-        return self.settings.idfobjects["PEOPLE"]
+        return self._idfobjects("PEOPLE")
     
     @property
     def lights(self) -> list:
         """
         The lighting list (in :class:`eppy.bunch_subclass.EpBunch` format)
         """
-        return self.settings.idfobjects["LIGHTS"]
+        return self._idfobjects("LIGHTS")
     
     @property
     def electric_equipment(self) -> list:
         """
         The list of electrical equipment (in :class:`eppy.bunch_subclass.EpBunch` format)
         """
-        return self.settings.idfobjects["ELECTRICEQUIPMENT"]
+        return self._idfobjects("ELECTRICEQUIPMENT")
         
     @property
     def thermostat(self) -> list:
         """
         The list of thermostats (in :class:`eppy.bunch_subclass.EpBunch` format)
         """
-        return self.settings.idfobjects["ZONECONTROL:THERMOSTAT"]
+        return self._idfobjects("ZONECONTROL:THERMOSTAT")
     
     @property
     def thermostat_dual_setpoint(self) -> list:
         """
         The list of thermostat dual set points (in :class:`eppy.bunch_subclass.EpBunch` format)
         """
-        return self.settings.idfobjects["THERMOSTATSETPOINT:DUALSETPOINT"]
+        return self._idfobjects("THERMOSTATSETPOINT:DUALSETPOINT")
     
     @property
     def output_variable_dictionary(self) -> EpBunch:
         """
         The output variable dictionary (in :class:`eppy.bunch_subclass.EpBunch` format)
         """
-        return self.settings.idfobjects["OUTPUT:VARIABLEDICTIONARY"][0]
+        return self._idfobjects("OUTPUT:VARIABLEDICTIONARY")[0]
     
     @output_variable_dictionary.setter
     def output_variable_dictionary(self, new_out_dict: EpBunch) -> None:
-        self.settings.idfobjects["OUTPUT:VARIABLEDICTIONARY"][0] = new_out_dict
+        self._idfobjects("OUTPUT:VARIABLEDICTIONARY")[0] = new_out_dict
     
     @property
     def output_variable(self) -> list:
         """
         The list of desired EnergyPlus simulation output variables (in :class:`eppy.bunch_subclass.EpBunch` format)
         """
-        return self.settings.idfobjects["OUTPUT:VARIABLE"]
+        return self._idfobjects("OUTPUT:VARIABLE")
     
     @property
     def output_diagnostics(self) -> EpBunch:
         """
         The EnergyPlus simulation output diagnostics (in :class:`eppy.bunch_subclass.EpBunch` format)
         """
-        return self.settings.idfobjects["OUTPUT:DIAGNOSTICS"][0]
+        return self._idfobjects("OUTPUT:DIAGNOSTICS")[0]
     
     @output_diagnostics.setter
     def output_diagnostics(self, new_out_diags: EpBunch) -> None:
-        self.settings.idfobjects["OUTPUT:DIAGNOSTICS"][0] = new_out_diags
+        self._idfobjects("OUTPUT:DIAGNOSTICS")[0] = new_out_diags
     
+    @property
+    def settings(self) -> IDF:
+        """
+        The EnergyPlus settings, stored as an :class:`IDF` object
+        """
+        return self._settings
+
+    @settings.setter
+    def settings(self, new_settings: IDF) -> None:
+        self._settings = new_settings
+        self._idf_cache = {}
+
+    def _idfobjects(self, key: str) -> list:
+        """
+        Cached lookup of the settings' ``idfobjects[key]``. The
+        cache is cleared whenever the settings are replaced or
+        overridden from csv files.
+        """
+        try:
+            return self._idf_cache[key]
+        except KeyError:
+            objects = self.settings.idfobjects[key]
+            self._idf_cache[key] = objects
+            return objects
+
     def print_settings(self) -> None:
         """
         Function to print the entire settings in a readable format. Interally, the SimstockDataframe stores settings as an :class:`IDF` object. This function essentially displays this object. 
@@ -750,7 +1039,7 @@ class SimstockDataframe:
 
         # Copy defaults from internal database into new settings directory
         _copy_directory_contents(
-            os.path.join(self.simstock_directory, "settings"),
+            _SETTINGS_DIR,
             os.path.join(self.settings_csv_path)
         )
 
@@ -785,6 +1074,7 @@ class SimstockDataframe:
             msg = "No csv folder found. Call create_csv_folder() first."
             raise FileNotFoundError(msg)
         _compile_csvs_to_idf(self.settings, self.settings_csv_path)
+        self._idf_cache = {}
 
     
     def _validate_osgb_column(self) -> None:
@@ -822,18 +1112,68 @@ class SimstockDataframe:
             raise TypeError(errmsg) from exc
 
     def _add_missing_cols(self) -> None:
-        missing = []
-        for col in self._required_cols:
-            if col not in self._df.columns:
-                missing.append(col)
-                print(f"Adding missing {col} column.")
-                self._df[col] = float('nan')
+        missing = [
+            col for col in self._required_cols if col not in self._df.columns
+            ]
+        for col in missing:
+            print(f"Adding missing {col} column.")
+
+        # Add all of the missing columns in one go
+        self._df = self._df.assign(
+            **{col: self._required_cols[col] for col in missing}
+            )
         if len(missing) > 0:
             print(f"Please populate the following columsn with data:")
             print(missing)
     
+    def _map_polygon_pairs(
+            self,
+            func: Callable,
+            polygons1: np.ndarray,
+            polygons2: np.ndarray
+            ) -> tuple:
+        """
+        Function to apply the vectorised pairwise function ``func``
+        to two aligned arrays of polygons. ``func`` must return a 
+        tuple of arrays. If ``n_jobs`` is not 1, the pairs are split
+        into chunks that are processed by a pool of threads; shapely
+        releases the GIL, so there is no need to pickle the polygons.
+        """
+        n_jobs = _n_workers(self.n_jobs)
+        if n_jobs == 1 or polygons1.__len__() < 2:
+            return func(polygons1, polygons2)
+        chunks = np.array_split(np.arange(polygons1.__len__()), n_jobs)
+        with ThreadPoolExecutor(max_workers=n_jobs) as executor:
+            results = list(executor.map(
+                lambda chunk: func(polygons1[chunk], polygons2[chunk]),
+                chunks
+                ))
+        return tuple(np.concatenate(arrays) for arrays in zip(*results))
+
+    def _set_column_dtypes(self) -> None:
+        """
+        Function to store the ``shading`` column as numpy bools and
+        the ``nofloors`` column as small integers, so that later
+        masking is vectorised rather than iterating over Python 
+        objects. Columns that cannot be converted cleanly, e.g.
+        because they contain missing values, are left unchanged.
+        """
+        shading = _bool_series(self._df['shading'])
+        if shading.notna().all():
+            self._df['shading'] = shading.astype(bool)
+
+        nofloors = self._df['nofloors']
+        if (
+            pd.api.types.is_numeric_dtype(nofloors)
+            and nofloors.notna().all()
+            and (nofloors % 1 == 0).all()
+        ):
+            self._df['nofloors'] = nofloors.astype(np.int16)
+
     def _add_interiors_column(self) -> None:
-        self._df['interiors'] = self._df['polygon'].map(algs._has_interior)
+        self._df['interiors'] = shp.get_num_interior_rings(
+            self._df['polygon'].to_numpy()
+            ) > 0
     
     
     def orientate_polygons(self, **kwargs) -> None:
@@ -847,7 +1187,9 @@ class SimstockDataframe:
         """
         self.__dict__.update(kwargs)
         self._add_interiors_column()
-        self._df['polygon'] = self._df['polygon'].map(algs._orientate)
+        self._df['polygon'] = algs._orientate_array(
+            self._df['polygon'].to_numpy()
+            )
 
 
     def _check_for_multipolygons(self) -> None:
@@ -863,15 +1205,19 @@ class SimstockDataframe:
         # multipolygon that needs fixing. A new flag column
         # keeps track of which things are true multi-polygons
         # (will equal True if so)
-        self._df[["flag", "polygon"]] = self._df["polygon"].apply(
-            algs._check_for_multi
-            ).apply(pd.Series)
+        polygons = self._df["polygon"].to_numpy(copy=True)
+        is_multi = shp.get_type_id(polygons) == shp.GeometryType.MULTIPOLYGON
+        num_geoms = shp.get_num_geometries(polygons)
+        trivial = is_multi & (num_geoms == 1)
+        polygons[trivial] = shp.get_geometry(polygons[trivial], 0)
+        self._df["polygon"] = polygons
         
         # If there are no non-trivial multipolygons, then we are
-        # done here and just drop the flag column
-        if not self._df["flag"].any():
-            self._df.drop("flag", axis=1, inplace=True)
+        # done here and there is no need for the flag column
+        flag = is_multi & (num_geoms != 1)
+        if not flag.any():
             return
+        self._df["flag"] = flag
 
         # Extract "osgb" values for entries with multiple polygons
         multipoly_osgb = self._df[self._df["flag"]]["osgb"].tolist()
@@ -898,8 +1244,8 @@ class SimstockDataframe:
             sdf.remove_duplicate_coords()
         """
         self.__dict__.update(kwargs)
-        self._df['polygon'] = self._df['polygon'].map(
-            algs._remove_duplicate_coords
+        self._df['polygon'] = algs._remove_duplicate_coords_array(
+            self._df['polygon'].to_numpy()
             )
 
     def polygon_topology(self, **kwargs) -> None:
@@ -924,34 +1270,43 @@ class SimstockDataframe:
             sdf.polygon_topology()
         """
         self.__dict__.update(kwargs)
-
-        # Create column named ``touching``. Each element
-        # is an empty list
-        length_range = range(self._df.__len__())
-        self._df['touching'] = pd.Series([] for _ in length_range)
-
-        # Iterate over all possible pairs of polygons in the data
-        for i, j in itertools.combinations(length_range, 2):
-            poly_i = self._df['polygon'][i]
-            poly_j = self._df['polygon'][j]
-            osgb_i = self._df['osgb'][i]
-            osgb_j = self._df['osgb'][j]
-            try:
-                # If polygon i touches polygon j, 
-                # then add j's osgb value to i's
-                # ``touching`` column. By symmetry, 
-                # also add i's osbg to j's 
-                # ``touching`` column
-                if algs._is_touching(poly_i, poly_j):
-                    self._df['touching'][i].append(osgb_j)
-                    self._df['touching'][j].append(osgb_i)
-            
-            # If polygon i intersects polygon j, then the
-            # _is_touching function will throw a ValueError.
-            # Catch this error and pass it on with context.
-            except ValueError as exc:
-                errmsg = f"Warning: OSGB {osgb_i} intersects {osgb_j}"
-                raise ValueError(errmsg) from exc
+        polygons = self._df['polygon'].to_numpy()
+        osgbs = self._df['osgb'].to_numpy()
+
+        # Prepare the polygons once, so that the predicates below
+        # reuse their prepared form rather than each building it
+        shp.prepare(polygons)
+
+        # Use a spatial index to find all pairs of intersecting 
+        # polygons (touching polygons also intersect), keeping
+        # each pair once, ordered by row. The index is built here,
+        # rather than cached, so that it always matches the current
+        # polygons however the dataframe has been edited
+        i, j = shp.STRtree(polygons).query(polygons, predicate="intersects")
+        order = np.lexsort((j, i))
+        i, j = i[order], j[order]
+        i, j = i[i < j], j[i < j]
+
+        # Polygons whose intersection is a single point are not 
+        # considered to be touching. Of the rest, any that 
+        # intersect without touching are overlapping, which
+        # is an error
+        touches, is_point = self._map_polygon_pairs(
+            algs._touches_and_is_point, polygons[i], polygons[j]
+            )
+        overlaps = ~is_point & ~touches
+        if overlaps.any():
+            k = np.argmax(overlaps)
+            errmsg = f"Warning: OSGB {osgbs[i[k]]} intersects {osgbs[j[k]]}"
+            raise ValueError(errmsg)
+
+        # Create column named ``touching``. The i-th element 
+        # lists the osgb values of all polygons touching polygon i
+        touching = _list_array(polygons.__len__())
+        for a, b in zip(i[~is_point], j[~is_point]):
+            touching[a].append(osgbs[b])
+            touching[b].append(osgbs[a])
+        self._df['touching'] = touching
 
     def polygon_tolerance(self, **kwargs) -> None:
         """
@@ -981,43 +1336,57 @@ class SimstockDataframe:
             print(sdf["simplify"])
         """
         self.__dict__.update(kwargs)
-        f = lambda x: algs._poly_tol(x, self.tol)
-        self._df['simplify'] = self._df['polygon'].map(f)
+        self._df['simplify'] = algs._polys_within_tol(
+            self._df['polygon'].to_numpy(), self.tol
+            )
 
     def _polygon_within_hole(self) -> None:
         """
         Function to find if any polygons are contained
         within the interiors of another.
         """
-
-        # Create column named ``poly_within_hole``. Each element
-        # is an empty list
-        length_range = range(self._df.__len__())
-        self._df['poly_within_hole'] = pd.Series([] for _ in length_range)
-
-        # Iterate over the cartesian product of polygons
-        for i, j in itertools.product(length_range, length_range):
-            if i != j and self._df['interiors'][i]:
-
-                # If polygon i has interiors, then check if polygon j
-                # touches polygon i
-                touches = self._df['osgb'][j] in self._df['touching'][i]
-
-                # Now iterate over the interiors of polygon i
-                for item in self._df['polygon'][i].interiors:
-                    item_poly = Polygon(item.coords[::-1])
-
-                    # If the interior both touchs and contains j, then we know
-                    # j exists within a hole inside i
-                    # We make a note of this in the `poly_within_hole` column
-                    if item_poly.contains(self._df['polygon'][j]) and touches:
-                        self._df['poly_within_hole'][i].append(
-                            self._df['osgb'][j]
-                            )
+        polygons = self._df['polygon'].to_numpy()
+        osgbs = self._df['osgb'].to_numpy()
+        touching = self._df['touching'].to_numpy()
+        poly_within_hole = _list_array(polygons.__len__())
+
+        # Only polygons with interiors can contain anything, so
+        # make a polygon of each of their holes, and query a
+        # spatial index over the polygons with all of them at 
+        # once for the polygons that each hole contains
+        rows = np.flatnonzero(self._df['interiors'].to_numpy())
+        n_holes = shp.get_num_interior_rings(polygons[rows])
+        owner = np.repeat(rows, n_holes)
+        ring_no = np.arange(owner.__len__()) - np.repeat(
+            np.cumsum(n_holes) - n_holes, n_holes
+            )
+        holes = shp.polygons(shp.get_interior_ring(polygons[owner], ring_no))
+        hole, j = shp.STRtree(polygons).query(holes, predicate="contains")
+        i = owner[hole]
+        order = np.lexsort((j, i))
+
+        # If the interior both touchs and contains j, then we know
+        # j exists within a hole inside i
+        # We make a note of this in the `poly_within_hole` column
+        for i, j in zip(i[order].tolist(), j[order].tolist()):
+            if j != i and osgbs[j] in touching[i]:
+                poly_within_hole[i].append(osgbs[j])
+        self._df['poly_within_hole'] = poly_within_hole
                        
     def _polygon_buffer(self) -> None:
-        for i, polygon in enumerate(self._df['polygon']):
-            if not polygon.is_valid:
+        osgb_index = self._osgb_index()
+        polygons = self._df['polygon'].to_numpy(copy=True)
+        indptr, indices = self._touching_adjacency(osgb_index)
+        neighbours = indices.tolist()
+
+        # Check the validity of all polygons at once. In the
+        # usual case they are all valid and there is nothing to do
+        invalid = ~shp.is_valid(polygons)
+        if not invalid.any():
+            return
+        for i in range(polygons.__len__()):
+            if invalid[i]:
+                polygon = polygons[i]
                 # If any polygons are not valid, 
                 # then we set the buffer to 0
                 new_polygon = polygon.buffer(0)
@@ -1026,40 +1395,25 @@ class SimstockDataframe:
                 # If this invalid polygon is touching anything, 
                 # then we find which coordinates have been removed
                 # and added when we set the buffer to 0
-                if self._df['touching'][i]:
-                    new_coords = list(
-                        set(list(new_polygon.exterior.coords)) - set(list(polygon.exterior.coords)))
-                    removed_coords = list(
-                        set(list(polygon.exterior.coords)) - set(list(new_polygon.exterior.coords)))
+                if indptr[i] != indptr[i + 1]:
+                    new_coords = algs._exterior_coords_difference(
+                        new_polygon, polygon
+                        )
+                    removed_coords = algs._exterior_coords_difference(
+                        polygon, new_polygon
+                        )
                     
                 # If any new coordinates were found, then we iterate
                 # over all polygons that this polygon touches, 
                 # and replace them with buffered polygons
                 if new_coords:
-                    for osgb_touching in self._df['touching'][i]:
-                        t_poly = self._df.loc[
-                                self._df['osbg'] == osgb_touching, 'polygon'
-                                ].values[0]
-                        self._df.loc[
-                            self._df['osgb'] == osgb_touching, 'polygon'
-                            ] = algs._buffered_polygon(t_poly, new_coords, removed_coords)
-
-    # This function seems redundant                   
-    def _touching_poly(self,
-                       osgb: str,
-                       polygon: Polygon, 
-                       osgb_list : list[str], 
-                       osgb_touching : list[str]
-                       ) -> list[str]:
-        for t in osgb_list:
-            if t != osgb:
-                # Not sure this if is necessary
-                t_polygon = self._df.loc[self._df['osgb'] == t, 'polygon'].values[0]
-                if t_polygon:
-                    if polygon.touches(t_polygon):
-                        osgb_touching.append(t)
-        return osgb_touching
-                        
+                    for j in neighbours[indptr[i]:indptr[i + 1]]:
+                        polygons[j] = algs._buffered_polygon(
+                            polygons[j], new_coords, removed_coords
+                            )
+                        invalid[j] = not polygons[j].is_valid
+        self._df['polygon'] = polygons
+
     def _polygon_simplify(self) -> None:
         """
         Internal function to apply simplification to 
@@ -1067,26 +1421,32 @@ class SimstockDataframe:
         as needing simplification.
         """
         # Iterate over unique polygons and see if they 
-        # the need simplifying
-        osgb_list = self._df['osgb'].unique().tolist()
-        for osgb in osgb_list:
-            if self._df.loc[self._df['osgb'] == osgb, 'simplify'].values[0]:
-                osgb_touching = list()
-                polygon = self._df.loc[
-                    self._df['osgb'] == osgb, 'polygon'
-                    ].values[0]
-                if polygon:
-                    # This could be done better: 
-                    # no need to be passing around the osgb list
-                    osgb_touching = self._touching_poly(
-                        osgb, polygon, osgb_list, osgb_touching
-                        )
-                    # OSGB touching could be stored as a class variable,
-                    # it is also in the dataframe already. The variable
-                    # osgb in this function should therefore be deprecated.
-                    self._df = smpl._polygon_simplifying(
-                        polygon, self._df, osgb, osgb_touching
-                        )
+        # the need simplifying. Rows are only flagged (not
+        # dropped) during simplification, so the osgb
+        # positions stay valid throughout the loop. The 
+        # polygons are updated in an array and written 
+        # back to the dataframe once at the end
+        osgbs = self._df['osgb'].to_numpy()
+        osgb_index = self._osgb_index()
+        polygons = self._df['polygon'].to_numpy(copy=True)
+        holes = self._df['poly_within_hole'].to_numpy()
+        touching = self._df['touching'].to_numpy()
+        first = np.zeros(polygons.__len__(), dtype=bool)
+        first[list(osgb_index.values())] = True
+        simplify = self._df['simplify'].to_numpy(dtype=bool) & first
+        for i in np.flatnonzero(simplify):
+            if polygons[i]:
+                # The neighbours come from the ``touching`` column
+                # computed by polygon_topology. Those removed by
+                # an earlier simplification pass are skipped
+                osgb_touching = sorted(
+                    (t for t in touching[i] if t in osgb_index),
+                    key=osgb_index.get
+                    )
+                smpl._polygon_simplifying(
+                    polygons, holes, osgbs[i], osgb_touching, osgb_index
+                    )
+        self._df['polygon'] = polygons
                         
     def polygon_simplification(self, **kwargs) -> None:
         """
@@ -1107,14 +1467,28 @@ class SimstockDataframe:
         **See also**: :py:meth:`polygon_tolerance`
         """
         self.__dict__.update(kwargs)
-        while self._df['simplify'].sum() > 0:
+        while self._df['simplify'].to_numpy().any():
+            previous = self._df['polygon'].to_numpy(copy=True)
             self._polygon_within_hole()
             self._polygon_simplify()
-            self._df = self._df.loc[
-                ~self._df['polygon'].isin([False])
-                ].reset_index(drop=True)
+            # Polygons removed by the simplification are set to None
+            keep = ~shp.is_missing(self._df['polygon'].to_numpy())
+            self._df = self._df.iloc[keep].reset_index(drop=True)
+            previous = previous[keep]
             self._polygon_buffer()
-            self.polygon_tolerance()
+
+            # Only polygons that were replaced during this pass can 
+            # have changed their tolerance check, so only re-assess those
+            polygons = self._df['polygon'].to_numpy()
+            changed = np.fromiter(
+                (new is not old for new, old in zip(polygons, previous)),
+                dtype=bool, count=polygons.__len__()
+                )
+            simplify = self._df['simplify'].to_numpy(dtype=bool, copy=True)
+            simplify[changed] = algs._polys_within_tol(
+                polygons[changed], self.tol
+                )
+            self._df['simplify'] = simplify
         try:
             self._df = self._df.drop(['simplify', 'poly_within_hole'], axis=1)
         except KeyError:
@@ -1130,82 +1504,89 @@ class SimstockDataframe:
             SimstockDataframe properties
         """
         self.__dict__.update(kwargs)
+        osgb_index = self._osgb_index()
+        polygons = self._df['polygon'].to_numpy(copy=True)
+        indptr, indices = self._touching_adjacency(osgb_index)
+        neighbours = indices.tolist()
+
+        # Intersections from the first pass, keyed by the ordered
+        # pair of positions, together with the polygons they were
+        # computed from. The second pass reuses an intersection
+        # as long as neither polygon has since been updated
+        intersections = dict()
 
         # Iterate over each polygon and then over each
         # polygon that it touches
-        for row in self._df.itertuples():
-            osgb_touching = row.touching
-            polygon = row.polygon
-            osgb = row.osgb
-            if osgb_touching:
-                for t in osgb_touching:
-
-                    # Remove collinear points from the intersection
-                    t_polygon = self._df.loc[
-                        self._df['osgb'] == t, 'polygon'
-                        ].values[0]
-                    partition = polygon.intersection(t_polygon)
-                    if partition.geom_type == 'MultiLineString':
-                        partition = linemerge(partition)
-                    partition_collinear_points = algs._collinear_points_list(
-                        partition)
-                    if partition_collinear_points:
-                        polygon = algs._update_polygon(
-                            polygon, partition_collinear_points)
-                        t_polygon = algs._update_polygon(
-                            t_polygon, partition_collinear_points)
-                        self._df.loc[
-                            self._df['osgb'] == t, 'polygon'
-                            ] = t_polygon
-                        self._df.loc[
-                            self._df['osgb'] == osgb, 'polygon'
-                            ] = polygon
+        for i in range(polygons.__len__()):
+            polygon = polygons[i]
+            for j in neighbours[indptr[i]:indptr[i + 1]]:
+                # Remove collinear points from the intersection
+                t_polygon = polygons[j]
+                partition = polygon.intersection(t_polygon)
+                intersections[(i, j)] = (polygon, t_polygon, partition)
+                if partition.geom_type == 'MultiLineString':
+                    partition = linemerge(partition)
+                partition_collinear_points = algs._collinear_points_list(
+                    partition)
+                if partition_collinear_points:
+                    polygon = algs._update_polygon(
+                        polygon, partition_collinear_points)
+                    polygons[j] = algs._update_polygon(
+                        t_polygon, partition_collinear_points)
+                    polygons[i] = polygon
         
         # Now iterate again over all of the polygons
         # If any of them touch anything, then carve
         # it up into inner and outer components
-        for row in self._df.itertuples():
-            osgb_touching = row.touching
-            polygon = row.polygon
-            osgb = row.osgb
-            if osgb_touching:
-                outer_ring = LineString(polygon.exterior)
-                inner_ring = MultiLineString(polygon.interiors)
-                exposed = unary_union((outer_ring, inner_ring))
+        exposed_walls = np.empty(polygons.__len__(), dtype=object)
+        horizontals = np.empty(polygons.__len__(), dtype=object)
+        for i in range(polygons.__len__()):
+            polygon = polygons[i]
+            if indptr[i] != indptr[i + 1]:
+                rings = algs._rings_union(polygon)
+                exposed = rings
 
                 # Then subtract any of the intersecting points from 
                 # the exposed areas and then remove collinear points
-                for t in osgb_touching:
-                    t_polygon = self._df.loc[
-                        self._df['osgb'] == t, 'polygon'
-                        ].values[0]
-                    exposed -= polygon.intersection(t_polygon)
+                for j in neighbours[indptr[i]:indptr[i + 1]]:
+                    t_polygon = polygons[j]
+                    cached = intersections.get((i, j))
+                    if (
+                        cached is not None
+                        and cached[0] is polygon
+                        and cached[1] is t_polygon
+                        ):
+                        exposed -= cached[2]
+                    else:
+                        exposed -= polygon.intersection(t_polygon)
                 exposed_collinear_points = algs._collinear_points_list(exposed)
                 if exposed_collinear_points:
                     exposed = algs._update_exposed(exposed, exposed_collinear_points)
                     polygon = algs._update_polygon(polygon, exposed_collinear_points)
-                horizontal = algs._remove_collinear_points_horizontal(polygon)
+                    rings = None
+                # The union of the rings can be reused, unless
+                # the polygon has just been updated
+                horizontal = algs._remove_collinear_points_horizontal(
+                    polygon, rings
+                    )
             else:
                 # If the polygon doesn't touch anything, then 
                 # remove the collinear points
                 polygon = algs._remove_collinear_points_horizontal(polygon)
                 horizontal = polygon
-                outer_ring = LineString(polygon.exterior)
-                inner_ring = MultiLineString(polygon.interiors)
-                exposed = unary_union((outer_ring, inner_ring))
+                exposed = algs._rings_union(polygon)
 
             # For each polygon store the coordinates of the 
             # exposed walls, the updated polygon and the 
             # horizontal polygon
-            self._df.loc[
-                self._df['osgb'] == osgb, 'polygon_exposed_wall'
-                ] = exposed
-            self._df.loc[
-                self._df['osgb'] == osgb, 'polygon'
-                ] = polygon
-            self._df.loc[
-                self._df['osgb'] == osgb, 'polygon_horizontal'
-                ] = horizontal
+            exposed_walls[i] = exposed
+            polygons[i] = polygon
+            horizontals[i] = horizontal
+
+        # Write the buffered results back in one go
+        self._df['polygon_exposed_wall'] = exposed_walls
+        self._df['polygon'] = polygons
+        self._df['polygon_horizontal'] = horizontals
         self.processed = True
 
     def bi_adj(self, **kwargs) -> None:
@@ -1225,22 +1606,30 @@ class SimstockDataframe:
         self.__dict__.update(kwargs)
         polygon_union = unary_union(self._df.polygon)
         if polygon_union.geom_type == "MultiPolygon":
-            for bi in polygon_union.geoms:
-                # Get a unique name for the BI which is based on a point
-                # within the BI so that it doesn't change if new areas are lassoed
-                rep_point = bi.representative_point()
-                bi_name = "bi_" + str(round(rep_point.x, 2)) + "_" + str(round(rep_point.y, 2))
-                bi_name = bi_name.replace(".", "-") #replace dots with dashes for filename compatibility
-                for row in self._df.itertuples():
-                    if row.polygon.within(bi):
-                        self._df.at[row.Index, 'bi'] = bi_name
+            bi_geoms = shp.get_parts(polygon_union)
+
+            # Get a unique name for each BI which is based on a point
+            # within the BI so that it doesn't change if new areas are lassoed
+            rep_points = shp.point_on_surface(bi_geoms)
+            bi_labels = np.array([
+                _bi_name(x, y) for x, y in zip(
+                    shp.get_x(rep_points).tolist(),
+                    shp.get_y(rep_points).tolist()
+                    )
+                ], dtype=object)
+
+            # Label every polygon with the BI it lies within 
+            # using a single bulk query of a spatial index over the BIs
+            poly_idx, bi_idx = shp.STRtree(bi_geoms).query(
+                self._df['polygon'].to_numpy(), predicate="within"
+                )
+            bi_names = np.full(self._df.__len__(), None, dtype=object)
+            bi_names[poly_idx] = bi_labels[bi_idx]
+            self._df['bi'] = bi_names
         else:
             # If there is only one BI
             rep_point = polygon_union.representative_point()
-            bi_name = "bi_" + str(round(rep_point.x, 2)) + "_" + str(round(rep_point.y, 2))
-            bi_name = bi_name.replace(".", "-")
-            for row in self._df.itertuples():
-                self._df.at[row.Index, 'bi'] = bi_name
+            self._df['bi'] = _bi_name(rep_point.x, rep_point.y)
         
         if len(self._df["bi"]) != len(self._df["bi"].dropna()):
             raise ValueError("Simstock was unable to resolve all built islands."
@@ -1266,7 +1655,7 @@ class SimstockDataframe:
             3. :py:meth:`polygon_topology`
             4. :py:meth:`polygon_tolerance`
             5. :py:meth:`polygon_simplification`
-            6. :py:meth:`polygon_topology`
+            6. :py:meth:`polygon_topology` (only if any polygons were simplified)
             7. :py:meth:`collinear_exterior`
             8. :py:meth:`polygon_topology`
             9. :py:meth:`bi_adj`
@@ -1275,7 +1664,8 @@ class SimstockDataframe:
 
         :param \**kwargs:
             Optional keyword parameters: any of the  
-            SimstockDataframe properties
+            SimstockDataframe properties, e.g. ``n_jobs`` to split
+            the pairwise touching check across several threads
 
         .. hint:: \ \ 
 
@@ -1283,14 +1673,22 @@ class SimstockDataframe:
 
         """
         self.__dict__.update(kwargs)
-        # Perform all of the steps,
-        # one after the other
-        self.orientate_polygons()
-        self.remove_duplicate_coords()
+        # Perform all of the steps, one after the other. Steps 1, 2
+        # and 4 are done together in a single pass over the polygons,
+        # which is valid since step 3 does not change the polygons
+        self._add_interiors_column()
+        polygons, simplify = algs._orientate_dedupe_and_tol(
+            self._df['polygon'].to_numpy(), self.tol
+            )
+        self._df['polygon'] = polygons
         self.polygon_topology()
-        self.polygon_tolerance()
+        self._df['simplify'] = simplify
+        # The topology only depends on the polygons, so it need 
+        # not be recomputed if none of them were simplified
+        simplified = self._df['simplify'].any()
         self.polygon_simplification()
-        self.polygon_topology()
+        if simplified:
+            self.polygon_topology()
         self.collinear_exterior()
         self.polygon_topology()
         self.bi_adj()
@@ -1305,9 +1703,9 @@ class IDFmanager:
     object for an E+ run.
 
     :param data:
-        The input data containing polygon information, and optionally built-island data.
+        The input data containing polygon information, and optionally built-island data. This can also be a pre-processed Pandas :class:`DataFrame`, or the path to a csv, parquet, feather, json or geopackage file containing one, in which case the default settings are used
     :type data: 
-        :class:`simstock.SimstockDataframe`
+        :class:`simstock.SimstockDataframe`, :class:`DataFrame`, str
     :param min_avail_width_for_window: 
         *Optional*. Do not place window if the wall width is less than this number
     :type min_avail_width_for_window:
@@ -1348,6 +1746,10 @@ class IDFmanager:
         *Optional*. Dictionary containing infiltration settings. If none is specified, then default settings will be used
     :type infiltration_dict:
         dict
+    :param n_jobs:
+        *Optional*. The number of EnergyPlus simulations to run at once. Defaults to 1, i.e. one after another. Use -1 to use all available CPUs
+    :type n_jobs:
+        int
 
     :raises TypeError:
         If the input data is not of type *str*, :class:`simstock.SimstockDataframe`, or :class:`DataFrame`
@@ -1382,6 +1784,12 @@ class IDFmanager:
         'polygon', 'osgb', 'shading', 'height', 'wwr', 'nofloors','construction', 'interiors', 'touching', 'polygon_exposed_wall',
         'polygon_horizontal'
     ]
+    _col_names_set = frozenset(_col_names)
+
+    # Columns holding shapely geometries
+    _geometry_cols = frozenset(
+        ['polygon', 'polygon_exposed_wall', 'polygon_horizontal']
+        )
 
     def __init__(self,
                  data: SimstockDataframe,
@@ -1394,7 +1802,8 @@ class IDFmanager:
                  epw: str = None,
                  buffer_radius: Union[float, int] = 50,
                  ventilation_dict: dict = None, 
-                 infiltration_dict: dict = None
+                 infiltration_dict: dict = None,
+                 n_jobs: int = 1
                  ) -> None:
         """
         Constructor method
@@ -1407,6 +1816,7 @@ class IDFmanager:
         self.bi_mode = bi_mode
         self.data_fname = data_fname
         self.save_building_count = save_building_count
+        self.n_jobs = n_jobs
 
         # Try and load data from simstockdataframe
         try:
@@ -1430,37 +1840,38 @@ class IDFmanager:
             )
             raise SimstockException(msg)
 
-        # Set the settings IDF to be the one specified 
-        # in the SimstockDataframe
-        self.idf = data.settings.copyidf()
+        # Set the settings IDF and weather file to be the ones 
+        # specified in the SimstockDataframe. Data loaded from a
+        # DataFrame or file has no settings, so the defaults are used
+        if isinstance(data, SimstockDataframe):
+            self.idf = data.settings.copyidf()
+            default_epw = data.epw
+        else:
+            if IDF.iddname is None:
+                IDF.setiddname(_default_idd_file())
+            self.idf = IDF(_SETTINGS_IDF)
+            default_epw = _DEFAULT_EPW
 
-        # Set the weather file to be the one specified in the 
-        # SimstockDataframe, unless user has specified it 
-        # as a keyword argument at initialisation
+        # The weather file can also be specified as a keyword 
+        # argument at initialisation
         if epw == None:
-            self.epw = data.epw
+            self.epw = default_epw
+        else:
+            self.epw = epw
 
         # Get simstock directory
-        current_file_path = inspect.getframeinfo(inspect.currentframe()).filename
-        absolute_file_path = os.path.abspath(current_file_path)
-        self.simstock_directory = os.path.dirname(absolute_file_path)
+        self.simstock_directory = _SIMSTOCK_DIR
 
         # Load in the ventilation and infiltration
         # dictionaries, if now provided by user
         if ventilation_dict == None:
-            json_fname = os.path.join(
-                self.simstock_directory, "settings", "ventilation_dict.json"
-                )
-            with open(json_fname, 'r') as json_file:
-                self.ventilation_dict = json.load(json_file)
+            with open(_VENTILATION_JSON, 'rb') as json_file:
+                self.ventilation_dict = _json_loads(json_file.read())
         else:
             self.ventilation_dict = ventilation_dict
         if infiltration_dict == None:
-            json_fname = os.path.join(
-                self.simstock_directory, "settings", "infiltration_dict.json"
-                )
-            with open(json_fname, 'r') as json_file:
-                self.infiltration_dict = json.load(json_file)
+            with open(_INFILTRATION_JSON, 'rb') as json_file:
+                self.infiltration_dict = _json_loads(json_file.read())
         else:
             self.infiltration_dict = infiltration_dict
 
@@ -1486,7 +1897,9 @@ class IDFmanager:
             The data that should contain somehow a dataframe.
             This data can either already be a simstock or 
             pandas data frame, or it can be a filename 
-            (including path) containing such.
+            (including path) of a csv, parquet, feather or
+            json file containing such, or of a geopackage, whose
+            first layer is read.
         :type data: 
             :class:`simstock.SimstockDataframe`, :class:`DataFrame`, str
 
@@ -1496,64 +1909,77 @@ class IDFmanager:
 
         # Extract the data frame using the appropriate
         # method based on type
-        if type(data) == SimstockDataframe:
-            self._sdf_to_df(data)
-        elif type(data) == DataFrame:
-            self._df_to_df(data)
-        elif type(data) == str:
-            self._str_to_df(data)
-        else:
-            raise TypeError  
+        loader = self._df_loaders.get(type(data))
+        if loader is None:
+            raise TypeError
+        loader(self, data)
     
+    # IDFmanager only reads the data frame, so it need not be
+    # copied eagerly if pandas' copy-on-write mode is enabled
     def _sdf_to_df(self, data: SimstockDataframe) -> None:
-        self.df = data._df.copy()
+        self.df = data._df.copy(deep=not _copy_on_write())
 
     def _df_to_df(self, data: DataFrame) -> None:
-        self.df = data.copy()
+        self.df = data.copy(deep=not _copy_on_write())
 
     def _str_to_df(self, data: str) -> None:
         if not os.path.exists(data):
             raise FileNotFoundError
-        try:
-            if data["-3:"] == "csv":
-                self.df = pd.read_csv(data)
-            elif data["-7:"] == "parquet":
-                self.df = pd.read_parquet(data)
-            elif data["-4:"] == "json":
-                self.df = pd.read_json(data)
-            else:
-                raise IOError
-        except IOError as exc:
-            raise IOError from exc
+        reader = _DF_READERS.get(os.path.splitext(data)[1].lower())
+        if reader is None:
+            raise IOError(
+                f"Unsupported file type: {data}. Expected one of "
+                f"{', '.join(_DF_READERS)}"
+                )
+        df = reader(data)
+
+        # Files store the geometries as wkt and the touching
+        # lists as their text, so load them back as objects
+        for col in self._geometry_cols.intersection(df.columns):
+            df[col] = _series_serialiser(df[col])
+        if "touching" in df.columns:
+            df["touching"] = df["touching"].map(
+                lambda x: literal_eval(x) if isinstance(x, str) else x
+                )
+        self.df = df
+
+    # Methods to load the data frame, by the type of the data
+    _df_loaders = {
+        SimstockDataframe: _sdf_to_df,
+        DataFrame: _df_to_df,
+        str: _str_to_df,
+    }
         
     @property
     def is_valid(self) -> bool:
         """
         Are all of the necessary column names present
         """
-        return all(col in self.df.columns for col in self._col_names)
+        return self._col_names_set.issubset(self.df.columns)
     
     @property
     def missing_columns(self) -> list:
         """
         Necessary column names that are missing from the data
         """
-        return list(set(self._col_names).difference(set(self.df.columns)))
+        return list(self._col_names_set.difference(self.df.columns))
     
 
-    def _get_osgb_value(
+    def _osgb_values(
             self,
             val_name: str,
-            zones_df: DataFrame,
-            zone: str
-            ) -> float:
-        """Gets the value of a specified attribute for the zone"""
+            zones_df: DataFrame
+            ) -> dict:
+        """
+        Gets a dict mapping each osgb in zones_df to the value of
+        a specified attribute. The dict is empty if zones_df has
+        no such attribute.
+        """
         try:
-            osgb_from_zone = "_".join(zone.split("_")[:-2])
-            value = zones_df[zones_df["osgb"]==osgb_from_zone][val_name]
-            return value.to_numpy()[0]
+            values = zones_df[val_name].to_numpy()
         except KeyError:
-            return 0.0
+            return {}
+        return dict(zip(zones_df["osgb"].to_numpy(), values))
     
 
     def create_model_idf(self, **kwargs) -> None:
@@ -1601,52 +2027,69 @@ class IDFmanager:
         if not self.data_fname:
             self.data_fname = _generate_unique_string()
 
-        if os.path.exists(self.out_dir):
-                shutil.rmtree(self.out_dir)
-        else:
-            os.makedirs(self.out_dir)
+        # Start from an empty output directory
+        shutil.rmtree(self.out_dir, ignore_errors=True)
+        os.makedirs(self.out_dir, exist_ok=True)
+
+        # The idf objects created below, one per built island, 
+        # or a single one if not in built island mode
+        self.bi_idf_list = []
+
+        # Each idf starts as a copy of the settings idf. Copying an
+        # IDF serialises and re-parses it, so serialise it just once
+        settings_idfstr = self.idf.idfstr()
+
+        # The ventilation and infiltration rates of each building
+        # do not depend on the built island, so look them up once
+        rates = (
+            self._osgb_values("ventilation_rate", self.df),
+            self._osgb_values("infiltration_rate", self.df)
+            )
             
         # If the dataframe contains a built island column
         if self.bi_mode:
 
-            # Calculate how many thermally simulated buildings are in each BI and output info as csv
-            bi_bldg_count = self.df[self.df["shading"]!=True]["bi"].value_counts()
+            # If requested, calculate how many thermally simulated buildings are in each BI and output info as csv.
+            # Only the bi column of those buildings is selected, rather than copying all of their data
             if self.save_building_count:
+                bi_bldg_count = self.df.loc[self.df["shading"]!=True, "bi"].value_counts()
                 bi_bldg_count.to_csv(
                     os.path.join(self.out_dir, f"{self.data_fname}_bi_bldg_count.csv")
                     )
 
-            # Iterate over unique building islands
-            self.bi_idf_list = []
+            # Iterate over unique building islands, partitioning the
+            # rows by built island once rather than scanning for each
+            bis = self.df['bi'].to_numpy()
+            bi_rows = self.df.groupby('bi', sort=False).indices
+            tree = shp.STRtree(self.df['polygon'].to_numpy())
             for bi in self.df['bi'].unique().tolist():
 
                 # Revert idf to settings idf
-                temp_idf = self.idf.copyidf()
+                temp_idf = IDF(io.StringIO(settings_idfstr))
             
                 # Change the name field of the building object
                 building_object = temp_idf.idfobjects['BUILDING'][0]
                 building_object.Name = bi
                 
                 # Get the data for the BI
-                bi_df = self.df[self.df['bi'] == bi]
+                bi_df = self.df.iloc[bi_rows[bi]]
 
-                # Get the data for other BIs to use as shading
-                rest  = self.df[self.df['bi'] != bi]
-
-                # Include other polygons which fall under the specified shading buffer radius
+                # Include polygons from other BIs which fall under the 
+                # specified shading buffer radius, to use as shading
+                shading_rows = self._shading_rows(bi_rows[bi], tree)
                 bi_df = pd.concat(
                         [
                         bi_df, 
-                        algs._shading_buffer(self.buffer_radius, bi_df, rest)
+                        self._as_shading(
+                            shading_rows[bis[shading_rows] != bi]
+                            )
                         ]
                     )
                 
                 # Only create idf if the BI is 
                 # not entirely composed of shading blocks
-                shading_vals_temp = bi_df['shading'].to_numpy()
-                shading_vals = [_assert_bool(v) for v in shading_vals_temp]
-                if not np.asarray(shading_vals).all():
-                    self._createidfs(temp_idf, bi_df)
+                if not _bool_series(bi_df['shading']).eq(True).all():
+                    self._createidfs(temp_idf, bi_df, rates)
                 else:
                     continue
                 
@@ -1657,31 +2100,32 @@ class IDFmanager:
         else: # Not built island mode
 
             # Revert idf to settings idf
-            temp_idf = self.idf.copyidf()
+            temp_idf = IDF(io.StringIO(settings_idfstr))
 
             # Change the name field of the building object
             building_object = temp_idf.idfobjects['BUILDING'][0]
             building_object.Name = self.data_fname
 
-             # Get non-shading data
-            df1 = self.df[self.df['shading'] == False]
+            # Split the data into shading, to be used for the other 
+            # BIs, and non-shading data with one pass over the column
+            rest_mask = _bool_series(self.df['shading']).eq(True).to_numpy()
+            df1 = self.df[~rest_mask]
             bi_list = df1["bi"].unique()
-            
-            # Get the data for other BIs to use as shading
-            rest = self.df[self.df['shading'] == True]
 
             # Include other polygons which fall under the specified shading buffer radius
-            shading_dfs = []
+            shading_rows = []
+            bi_rows = self.df.groupby('bi', sort=False).indices
+            tree = shp.STRtree(self.df['polygon'].to_numpy())
             for bi in bi_list:
-                # Get the data for the BI
-                bi_df = self.df[self.df['bi'] == bi]
-
                 # Buffer each BI to specified radius and include shading which falls within this
-                shading_dfs.append(algs._shading_buffer(self.buffer_radius, bi_df, rest))
+                shading_rows.append(self._shading_rows(bi_rows[bi], tree))
 
-            # Combine these separate shading DataFrames and drop duplicate rows
-            shading_df = pd.concat(shading_dfs)
-            shading_df = shading_df.drop_duplicates()
+            # Combine the rows found for each BI, keeping the first 
+            # occurrence of each, and take them from the data at once
+            shading_rows = np.concatenate(shading_rows)
+            shading_rows = shading_rows[rest_mask[shading_rows]]
+            _, first = np.unique(shading_rows, return_index=True)
+            shading_df = self._as_shading(shading_rows[np.sort(first)])
 
             # Append the shading to the main DataFrame
             if self.buffer_radius != 0:
@@ -1693,15 +2137,17 @@ class IDFmanager:
                 df1.loc[:, "touching"] = ["[]"] * len(df1)
 
             # Only create idf if it is not entirely composed of shading blocks
-            shading_vals_temp = df1['shading'].to_numpy()
-            shading_vals = [_assert_bool(v) for v in shading_vals_temp]
-            if not np.asarray(shading_vals).all():
+            if not _bool_series(df1['shading']).eq(True).all():
 
-                # If requested, output csv which excludes any buildings not within the shading buffer
-                df1.to_csv(os.path.join(self.out_dir, f"{self.data_fname}_final.csv"))
+                # If requested, output csv which excludes any buildings not within the shading buffer.
+                # The geometries are left out, as writing each one's text is slow and the
+                # csv is only a record of which buildings were modelled
+                df1.drop(columns=["polygon"]).to_csv(
+                    os.path.join(self.out_dir, f"{self.data_fname}_final.csv")
+                    )
 
                 # Generate the idf file
-                self._createidfs(temp_idf, df1)
+                self._createidfs(temp_idf, df1, rates)
 
             else:
                 raise Exception("There are no thermal zones to create! All zones are shading.")
@@ -1709,89 +2155,122 @@ class IDFmanager:
             self.bi_idf_list.append(temp_idf)
 
 
+    def _shading_rows(
+            self,
+            bi_rows: np.ndarray,
+            tree: shp.STRtree
+            ) -> np.ndarray:
+        """
+        Internal function to get the sorted positions of the rows of 
+        the data that fall within the shading buffer radius of the rows
+        at positions ``bi_rows``. ``tree`` is a spatial index over all
+        of the data's polygons. Callers are left to exclude the rows
+        that should not be used as shading.
+        """
+        if self.buffer_radius == '':
+            # All other buildings are to be included as shading
+            return np.arange(len(self.df))
+        return algs._shading_buffer_rows(
+            self.buffer_radius,
+            self.df['polygon'].to_numpy()[bi_rows],
+            tree
+            )
+
+    def _as_shading(self, rows: np.ndarray) -> DataFrame:
+        """
+        Internal function to get a copy of the rows of the data
+        at the given positions, set to be shading.
+        """
+        within_buffer = self.df.iloc[rows].copy()
+        within_buffer["shading"] = True
+        return within_buffer
+
     def _createidfs(
             self,
             temp_idf: IDF,
-            bi_df: DataFrame
+            bi_df: DataFrame,
+            rates: tuple
             ) -> None:
         """
-        Internal function to create IDF objects for each built island, or for the entire model
+        Internal function to create IDF objects for each built island, or for the entire model.
+        ``rates`` holds the dicts mapping each osgb to its ventilation and infiltration rates.
         """
     
-        # Move all objects towards origins
-        origin = bi_df['polygon'].iloc[0]
-        origin = list(origin.exterior.coords[0])
+        # Move all objects towards origins, taken as the first 
+        # exterior coordinate of the first polygon
+        origin = shp.get_coordinates(bi_df['polygon'].iloc[0])[0].tolist()
         origin.append(0)
 
-        bi_df['shading'] = bi_df['shading'].apply(_assert_bool)
+        # Split the rows into shading and thermal zones with 
+        # boolean masks computed once from the column values
+        shading = _bool_series(bi_df['shading'])
+        bi_df['shading'] = shading
+        shading = shading.to_numpy()
+        is_shading = shading == True
+        is_zone = shading == False
         
         # Shading volumes converted to shading objects
-        shading_df = bi_df.loc[bi_df['shading'] == True]
-        shading_df.apply(ialgs._shading_volumes, args=(self.df, temp_idf, origin,), axis=1)
+        shading_df = bi_df[is_shading]
+        ialgs._shading_volumes(shading_df, self.df, temp_idf, origin)
 
         # Polygons with zones converted to thermal zones based on floor number
-        zones_df = bi_df.loc[bi_df['shading'] == False]
+        zones_df = bi_df[is_zone]
         zone_use_dict = {} 
-        zones_df.apply(ialgs._thermal_zones, args=(bi_df, temp_idf, origin, self.min_avail_width_for_window, self.min_avail_height, zone_use_dict,), axis=1)
+        adjacent = ialgs._osgb_lookup(bi_df)
+        for row in ialgs._rows(zones_df):
+            ialgs._thermal_zones(row, adjacent, temp_idf, origin, self.min_avail_width_for_window, self.min_avail_height, zone_use_dict)
 
         # Extract names of thermal zones:
-        zones = temp_idf.idfobjects['ZONE']
-        zone_names = list()
-        for zone in zones:
-            zone_names.append(zone.Name)
+        zone_names = [zone.Name for zone in temp_idf.idfobjects['ZONE']]
 
         # Plugin feature: mixed-use
         ialgs._mixed_use(temp_idf, zone_use_dict)
 
-        # Ideal loads system
+        # Ideal loads system. The fields of every zone's objects are
+        # collected first, and the objects then created class by class
+        hvac_objects = {
+            classname: [] for classname in ialgs._IDEAL_LOADS_CLASSES
+        }
+        flow_rate_objects = []
+        ventilation_rates, infiltration_rates = rates
         for zone in zone_names:
-            system_name = f"{zone}_HVAC"
-            eq_name = f"{zone}_Eq"
-            supp_air_node = f"{zone}_supply"
-            air_node = f"{zone}_air_node"
-            ret_air_node = f"{zone}_return"
-
-            temp_idf.newidfobject('ZONEHVAC:IDEALLOADSAIRSYSTEM',
-                                Name=system_name,
-                                Zone_Supply_Air_Node_Name=supp_air_node,
-                                Dehumidification_Control_Type='None')
-
-            temp_idf.newidfobject('ZONEHVAC:EQUIPMENTLIST',
-                                Name=eq_name,
-                                Zone_Equipment_1_Object_Type='ZONEHVAC:IDEALLOADSAIRSYSTEM',
-                                Zone_Equipment_1_Name=system_name,
-                                Zone_Equipment_1_Cooling_Sequence=1,
-                                Zone_Equipment_1_Heating_or_NoLoad_Sequence=1)
-
-            temp_idf.newidfobject('ZONEHVAC:EQUIPMENTCONNECTIONS',
-                                Zone_Name=zone,
-                                Zone_Conditioning_Equipment_List_Name=eq_name,
-                                Zone_Air_Inlet_Node_or_NodeList_Name=supp_air_node,
-                                Zone_Air_Node_Name=air_node,
-                                Zone_Return_Air_Node_or_NodeList_Name=ret_air_node)
+            for classname, fields in zip(
+                ialgs._IDEAL_LOADS_CLASSES, ialgs._ideal_loads_fields(zone)
+                ):
+                hvac_objects[classname].append(fields)
         
             # Get specified inputs for zone
-            ventilation_rate = self._get_osgb_value("ventilation_rate", zones_df, zone)
-            infiltration_rate = self._get_osgb_value("infiltration_rate", zones_df, zone)
+            zone_use, osgb_from_zone = zone_use_dict[zone]
+            ventilation_rate = ventilation_rates.get(osgb_from_zone, 0.0)
+            infiltration_rate = infiltration_rates.get(osgb_from_zone, 0.0)
 
-            # Get the rest of the default obj values from dict
-            zone_ventilation_dict = copy.deepcopy(self.ventilation_dict)
-            zone_infiltration_dict = copy.deepcopy(self.infiltration_dict)
+            # Get the rest of the default obj values from dict. The 
+            # fields are all scalars, so a shallow copy is enough
+            zone_ventilation_dict = {**self.ventilation_dict}
+            zone_infiltration_dict = {**self.infiltration_dict}
 
             # Set the name, zone name and ventilation rate
             zone_ventilation_dict["Name"] = zone + "_ventilation"
             zone_ventilation_dict["Zone_or_ZoneList_Name"] = zone
             zone_ventilation_dict["Air_Changes_per_Hour"] = ventilation_rate
-            zone_ventilation_dict["Schedule_Name"] = zone_use_dict[zone] + "_Occ"
+            zone_ventilation_dict["Schedule_Name"] = zone_use + "_Occ"
 
             # Same for infiltration
             zone_infiltration_dict["Name"] = zone + "_infiltration"
             zone_infiltration_dict["Zone_or_ZoneList_Name"] = zone
             zone_infiltration_dict["Air_Changes_per_Hour"] = infiltration_rate
 
-            # Add the ventilation idf object
-            temp_idf.newidfobject(**zone_ventilation_dict)
-            temp_idf.newidfobject(**zone_infiltration_dict)
+            flow_rate_objects.append(zone_ventilation_dict)
+            flow_rate_objects.append(zone_infiltration_dict)
+
+        newidfobject = temp_idf.newidfobject
+        for classname, objects in hvac_objects.items():
+            for fields in objects:
+                newidfobject(classname, **fields)
+
+        # Add the ventilation and infiltration idf objects
+        for fields in flow_rate_objects:
+            newidfobject(**fields)
 
 
     def save_idfs(self, **kwargs) -> None:
@@ -1870,20 +2349,119 @@ class IDFmanager:
         # Iterate over the list of idfs that have been created
         # and run them, putting the results of each into 
         # a new subdirectory
+        n_jobs = _n_workers(self.n_jobs)
+        runs = []
         for j, idf in enumerate(self.bi_idf_list):
 
             # Create a new subdirectory for this build island
             # idf within the out_dir directory.
             # If the directory already exists, then 
-            # clear its contents
+            # clear its contents in place
             new_dir_path = os.path.join(
                 self.out_dir, f"built_island_{j}_ep_outputs"
                 )
-            if os.path.exists(new_dir_path):
-                shutil.rmtree(new_dir_path)
+            os.makedirs(new_dir_path, exist_ok=True)
+            _delete_directory_contents(new_dir_path)
+
+            # Run energy plus. The worker processes are given the
+            # epw directly, so the idf only needs it if run here
+            if n_jobs == 1:
+                idf.epw = self.epw
+                idf.run(output_directory=new_dir_path)
             else:
-                os.makedirs(new_dir_path)
+                # The idf is saved below so that a worker process can load it
+                new_dir_path = os.path.abspath(new_dir_path)
+                idf_fname = os.path.join(new_dir_path, f"built_island_{j}.idf")
+                runs.append((idf, idf_fname, new_dir_path))
+
+        # Each EnergyPlus simulation is a separate single-threaded
+        # process, so independent built islands can be run at once.
+        # A copy of each idf is saved for them to load, which leaves 
+        # the in-memory idfs' names unchanged
+        if runs:
+            idfs, idf_fnames, dir_paths = zip(*runs)
+            for idf, idf_fname in zip(idfs, idf_fnames):
+                idf.savecopy(idf_fname)
+            with ProcessPoolExecutor(max_workers=n_jobs) as executor:
+                list(executor.map(
+                    _run_idf,
+                    idf_fnames,
+                    itertools.repeat(os.path.abspath(self.epw)),
+                    itertools.repeat(IDF.iddname),
+                    dir_paths
+                    ))
+
+
+def _create_model_idf(
+        sdf: SimstockDataframe,
+        out_dir: str,
+        kwargs: dict
+        ) -> None:
+    """
+    Function to create and save the model IDFs of a 
+    SimstockDataframe in a worker process.
+    """
+    manager = IDFmanager(sdf, out_dir=out_dir, **kwargs)
+    manager.create_model_idf()
+    manager.save_idfs()
+
 
-            # Run energy plus
-            idf.epw = self.epw
-            idf.run(output_directory=new_dir_path)
+def create_idfs(
+        sdfs: list,
+        out_dirs: list,
+        n_jobs: int = -1,
+        **kwargs
+        ) -> None:
+    """
+    Function to create and save the model IDFs of several independent
+    SimstockDataframes at once, e.g. for different areas or scenarios.
+    Each SimstockDataframe is handled by its own :class:`IDFmanager` 
+    in a separate process, and its IDFs saved into the corresponding 
+    output directory. The SimstockDataframes are pickled to be sent
+    to the worker processes.
+
+    :param sdfs:
+        The pre-processed SimstockDataframes
+    :type sdfs:
+        list[:class:`SimstockDataframe`]
+    :param out_dirs:
+        The output directory for the IDFs of each SimstockDataframe
+    :type out_dirs:
+        list[str]
+    :param n_jobs:
+        *Optional*. The number of processes to use. Defaults to -1, 
+        i.e. all available CPUs
+    :type n_jobs:
+        int
+    :param \**kwargs:
+        Optional keyword parameters passed on to each 
+        :class:`IDFmanager`, e.g. ``bi_mode`` or ``buffer_radius``
+
+    :raises ValueError:
+        If ``sdfs`` and ``out_dirs`` are of different lengths, or 
+        ``n_jobs`` is neither -1 nor a positive integer
+
+    Example
+    ~~~~~~~
+    .. code-block:: python
+
+        import simstock as sim
+
+        # given pre-processed SimstockDataframes sdf1 and sdf2
+        sim.create_idfs([sdf1, sdf2], ["outs/area1", "outs/area2"])
+    """
+    if sdfs.__len__() != out_dirs.__len__():
+        raise ValueError("sdfs and out_dirs must be of the same length.")
+    n_jobs = _n_workers(n_jobs)
+
+    # Send the SimstockDataframes to the workers in chunks,
+    # to reduce the number of round trips
+    chunksize = max(1, sdfs.__len__() // (4 * n_jobs))
+    with ProcessPoolExecutor(max_workers=n_jobs) as executor:
+        list(executor.map(
+            _create_model_idf,
+            sdfs,
+            out_dirs,
+            itertools.repeat(kwargs),
+            chunksize=chunksize
+            ))
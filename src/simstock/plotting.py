@@ -3,13 +3,9 @@ Plotting module containing routines for plotting
 basic geometries.
 """
 
-from typing import Any, Union
+from __future__ import annotations
+from typing import Any, Union, TYPE_CHECKING
 import numpy as np
-import matplotlib.pyplot as plt
-from matplotlib.path import Path
-from matplotlib.patches import PathPatch
-from matplotlib.collections import PatchCollection
-from matplotlib.axes._axes import Axes
 from shapely.geometry import (
     Polygon,
     Point,
@@ -20,6 +16,11 @@ from pandas.core.series import Series
 from pandas.core.frame import DataFrame
 from simstock.base import SimstockDataframe
 
+# matplotlib is only imported when something is actually plotted,
+# so that importing simstock (e.g. in worker processes) stays cheap
+if TYPE_CHECKING:
+    from matplotlib.axes._axes import Axes
+
 
 def plot(
         sdf: Union[SimstockDataframe, Series, DataFrame],
@@ -132,6 +133,7 @@ def _plot_geometries(geoms: list, **kwargs) -> Axes:
         ax = kwargs["ax"]
         kwargs.pop("ax")
     else:
+        import matplotlib.pyplot as plt
         _, ax = plt.subplots()
 
     try:
@@ -174,6 +176,10 @@ def _plot_polygon(geom: Polygon, ax: Axes, **kwargs) -> None:
     """
     Function to plot a polygon to ax
     """
+    from matplotlib.path import Path
+    from matplotlib.patches import PathPatch
+    from matplotlib.collections import PatchCollection
+
     path = Path.make_compound_path(
         Path(np.asarray(geom.exterior.coords)[:, :2]),
         *[Path(np.asarray(ring.coords)[:, :2]) for ring in geom.interiors])
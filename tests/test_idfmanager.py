@@ -0,0 +1,128 @@
+import os
+import tempfile
+import unittest
+from simstock.base import IDFmanager, create_idfs
+from simstock.io import read_csv
+from simstock._utils._exceptions import SimstockException
+
+
+class IDFmanagerLoadTestCase(unittest.TestCase):
+
+    def assert_loaded(self, path: str) -> None:
+        """
+        Loading raw (not pre-processed) data should get as far as
+        validating its columns, which only happens once the file
+        has been read.
+        """
+        with self.assertRaises(SimstockException) as cm:
+            IDFmanager(path)
+        self.assertIn("touching", str(cm.exception))
+
+    def test_load_csv_path(self) -> None:
+        """
+        Test that IDFmanager reads a csv file given its path.
+        """
+        self.assert_loaded("tests/data/test_data.csv")
+
+    def test_load_gpkg_path(self) -> None:
+        """
+        Test that IDFmanager reads a geopackage given its path.
+        """
+        self.assert_loaded("tests/data/S7_data.gpkg")
+
+    def test_load_unsupported_path(self) -> None:
+        """
+        Test that a file with an unsupported extension raises
+        an IOError.
+        """
+        with self.assertRaises(IOError):
+            IDFmanager("tests/data/test.idf")
+
+    def test_load_missing_path(self) -> None:
+        """
+        Test that a file that does not exist raises a
+        FileNotFoundError.
+        """
+        with self.assertRaises(FileNotFoundError):
+            IDFmanager("tests/data/missing.csv")
+
+
+class IDFmanagerCreateTestCase(unittest.TestCase):
+
+    def setUp(self) -> None:
+        """
+        Pre-process the test data, and count the model IDFs
+        created from it as a SimstockDataframe.
+        """
+        self.sdf = read_csv("tests/data/test_data.csv")
+        self.sdf.preprocessing()
+        self.tmp = tempfile.TemporaryDirectory()
+        manager = IDFmanager(self.sdf, out_dir=os.path.join(self.tmp.name, "sdf"))
+        manager.create_model_idf()
+        self.n_idfs = len(manager.bi_idf_list)
+
+    def assert_creates_idfs(self, data) -> None:
+        """
+        Creating the model IDFs from data should give the same 
+        number of IDFs as from the SimstockDataframe.
+        """
+        manager = IDFmanager(data, out_dir=os.path.join(self.tmp.name, "outs"))
+        manager.create_model_idf()
+        self.assertEqual(len(manager.bi_idf_list), self.n_idfs)
+
+    def test_create_from_csv_path(self) -> None:
+        """
+        Test that IDFs can be created from a pre-processed csv
+        file given its path.
+        """
+        path = os.path.join(self.tmp.name, "processed.csv")
+        self.sdf._df.to_csv(path, index=False)
+        self.assert_creates_idfs(path)
+
+    def test_create_from_dataframe(self) -> None:
+        """
+        Test that IDFs can be created from a pre-processed 
+        pandas DataFrame.
+        """
+        self.assert_creates_idfs(self.sdf._df)
+
+    def tearDown(self) -> None:
+        self.tmp.cleanup()
+
+
+class CreateIDFsTestCase(unittest.TestCase):
+
+    def test_create_idfs(self) -> None:
+        """
+        Test that create_idfs saves the model IDFs of each
+        SimstockDataframe into its own output directory, the
+        same as creating them one at a time.
+        """
+        sdf = read_csv("tests/data/test_data.csv")
+        sdf.preprocessing()
+        with tempfile.TemporaryDirectory() as tmp:
+            out_dirs = [os.path.join(tmp, f"area{i}") for i in range(2)]
+            create_idfs([sdf, sdf], out_dirs, n_jobs=2)
+
+            manager = IDFmanager(sdf, out_dir=os.path.join(tmp, "single"))
+            manager.create_model_idf()
+            expected = [
+                f"built_island_{j}.idf" 
+                for j in range(len(manager.bi_idf_list))
+                ]
+            for out_dir in out_dirs:
+                self.assertEqual(sorted(os.listdir(out_dir)), sorted(expected))
+
+    def test_create_idfs_invalid_n_jobs(self) -> None:
+        """
+        Test that an n_jobs that is neither -1 nor a positive
+        integer raises a ValueError.
+        """
+        sdf = read_csv("tests/data/test_data.csv")
+        for n_jobs in (0, -2):
+            with self.assertRaises(ValueError):
+                create_idfs([sdf], ["outs"], n_jobs=n_jobs)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,6 +1,9 @@
 import unittest 
+import pickle
 import pandas as pd
+from shapely.geometry import box, Polygon
 from simstock.base import SimstockDataframe  
+from simstock.io import read_csv
 
 
 class SimstockDataframeSetUpTestCase(unittest.TestCase):
@@ -115,6 +118,63 @@ class SimstockDataframeSetUpTestCase(unittest.TestCase):
         with self.assertRaises(KeyError):
             SimstockDataframe(self.df_invalid_names)
 
+    def test_polygon_topology_after_loc_edit(self) -> None:
+        """
+        Test that polygon_topology reflects polygons edited 
+        through ``loc`` after it has already been run once.
+        """
+        sdf = SimstockDataframe({
+            "osgb": ["a", "b", "c"],
+            "polygon": [box(0, 0, 10, 10), box(10, 0, 20, 10), box(5, 20, 15, 30)]
+        })
+        sdf.polygon_topology()
+        sdf.loc[2, "polygon"] = box(20, 0, 30, 10)
+        sdf.polygon_topology()
+        self.assertEqual(sdf["touching"].tolist(), [["b"], ["a", "c"], ["b"]])
+
+    def test_is_valid_after_loc_edit(self) -> None:
+        """
+        Test that is_valid reflects a polygon made invalid 
+        through ``loc`` after it has already been checked.
+        """
+        sdf = SimstockDataframe(self.dict_valid_names)
+        self.assertEqual(sdf.is_valid.all(), True)
+        sdf.loc[0, "polygon"] = Polygon([(0, 0), (1, 1), (1, 0), (0, 1)])
+        self.assertEqual(sdf.is_valid.tolist(), [False, True, True])
+
+    def test_polygon_topology_threaded(self) -> None:
+        """
+        Test that splitting the pairwise touching check across 
+        threads gives the same ``touching`` column as running it
+        in a single thread.
+        """
+        serial = read_csv("tests/data/test_data.csv")
+        serial.polygon_topology(n_jobs=1)
+        threaded = read_csv("tests/data/test_data.csv")
+        threaded.polygon_topology(n_jobs=2)
+        self.assertEqual(
+            serial["touching"].tolist(), threaded["touching"].tolist()
+            )
+
+    def test_pickle_round_trip(self) -> None:
+        """
+        Test that a simstock dataframe can be pickled and 
+        restored with its data and settings intact.
+        """
+        sdf = read_csv("tests/data/test_data.csv")
+        sdf.preprocessing()
+        restored = pickle.loads(pickle.dumps(sdf))
+        self.assertEqual(
+            restored["osgb"].tolist(), sdf["osgb"].tolist()
+            )
+        self.assertEqual(
+            restored["touching"].tolist(), sdf["touching"].tolist()
+            )
+        self.assertEqual(
+            restored.settings.idfstr(), sdf.settings.idfstr()
+            )
+        self.assertEqual(restored.processed, True)
+
     def tearDown(self) -> None:
         return super().tearDown()
 